@@ -52,7 +52,7 @@ from monitor.config import (
 )
 
 
-def send_email_notification(subject, message, priority='default', dashboard_url=None, chart_url=None, debug=False, include_status=True, inline_image_path=None, inline_image_link=None, include_ring_snapshot=True):
+def send_email_notification(subject, message, priority='default', dashboard_url=None, chart_url=None, debug=False, include_status=True, inline_image_path=None, inline_image_link=None, include_ring_snapshot=True, status_snapshot=None):
     """
     Send HTML email notification with embedded chart and system status
 
@@ -64,6 +64,8 @@ def send_email_notification(subject, message, priority='default', dashboard_url=
         chart_url: URL of chart image to embed
         debug: Print debug info
         include_status: Include current system status in email (default: True)
+        status_snapshot: Readings the caller already has ('tank', 'pressure', 'float', 'relay');
+            any that are present are used instead of querying the tank site / sensors again
         inline_image_path: Local file path to embed as the first image in the email
         inline_image_link: URL to wrap the inline image in as a hyperlink
 
@@ -108,7 +110,7 @@ def send_email_notification(subject, message, priority='default', dashboard_url=
         # Fetch current system status if requested
         status_data = None
         if include_status:
-            status_data = fetch_system_status(debug=debug)
+            status_data = fetch_system_status(debug=debug, status_snapshot=status_snapshot)
 
         # Fetch Ring snapshot if requested
         ring_bytes = None
@@ -439,8 +441,9 @@ def get_cached_ecobee_temp(max_age_hours=24):
         return None
 
 
-def fetch_system_status(debug=False):
-    """Fetch current system status (tank, sensors, stats, relays, events, occupancy, reservations)"""
+def fetch_system_status(debug=False, status_snapshot=None):
+    """Fetch current system status (tank, sensors, stats, relays, events, occupancy, reservations).
+    Entries supplied in status_snapshot are reused rather than read again."""
     try:
         from monitor.tank import get_tank_data
         from monitor.gpio_helpers import (
@@ -452,15 +455,17 @@ def fetch_system_status(debug=False):
         import os
         import csv
 
+        status_snapshot = status_snapshot or {}
+
         # Fetch tank data
-        tank_data = get_tank_data(TANK_URL)
+        tank_data = status_snapshot.get('tank') or get_tank_data(TANK_URL)
 
         # Read sensors (will work even without GPIO init using command fallback)
-        pressure = read_pressure()
-        float_state = read_float_sensor()
+        pressure = status_snapshot['pressure'] if 'pressure' in status_snapshot else read_pressure()
+        float_state = status_snapshot['float'] if 'float' in status_snapshot else read_float_sensor()
 
         # Get relay status
-        relay_status = get_all_relay_status()
+        relay_status = status_snapshot.get('relay') or get_all_relay_status()
 
         # Get stats from snapshots
         stats = None
@@ -27,6 +27,11 @@ _gpio_lock = threading.Lock()
 _gpio_initialized = False
 _last_pressure_state = None  # Track last known good state
 
+# Pressure edge wakeups for wait_for_pressure_change()
+_PRESSURE_BOUNCE_MS = 200
+_pressure_edge = threading.Event()
+_pressure_edge_detect = None  # None = not set up yet, False = unavailable (sleep instead)
+
 def init_gpio():
     """
     One-time GPIO initialization. Call this once at program startup.
@@ -54,12 +59,8 @@ def init_gpio():
 def _read_pin_via_gpio_command(pin):
     """Read pin value using gpio command-line tool (works with multiple processes)"""
     try:
-        result = subprocess.run(['gpio', '-g', 'read', str(pin)],
-                              capture_output=True, text=True, check=False, timeout=1)
-        if result.returncode != 0:
-            return None
-        value = int(result.stdout.strip())
-        return value
+        return int(subprocess.check_output(['gpio', '-g', 'read', str(pin)],
+                                           stderr=subprocess.DEVNULL, timeout=1))
     except Exception as e:
         return None
 
@@ -115,6 +116,42 @@ def read_pressure():
     # Fallback to gpio command (no retry logic for now)
     return _read_pin_via_gpio_command(PRESSURE_PIN)
 
+def _on_pressure_edge(channel):
+    """RPi.GPIO callback (runs on its event thread) for either pressure edge"""
+    _pressure_edge.set()
+
+def wait_for_pressure_change(timeout):
+    """
+    Block until the pressure pin changes state, interrupt_pressure_wait() is called,
+    or timeout seconds pass. Returns True if woken early, False on timeout.
+
+    Edge detection is registered on first use; if it isn't available (no RPi.GPIO,
+    GPIO not initialized, or the pin is claimed elsewhere) only the timeout and
+    interrupt_pressure_wait() end the wait.
+    The caller should still read_pressure() afterwards - the edge is only a wakeup.
+    """
+    global _pressure_edge_detect
+
+    if timeout <= 0:
+        return False
+
+    if _pressure_edge_detect is None and _gpio_initialized:
+        try:
+            GPIO.add_event_detect(PRESSURE_PIN, GPIO.BOTH, callback=_on_pressure_edge,
+                                  bouncetime=_PRESSURE_BOUNCE_MS)
+            _pressure_edge_detect = True
+        except Exception as e:
+            _pressure_edge_detect = False
+            print(f"Pressure edge detection unavailable, polling instead: {e}", file=sys.stderr)
+
+    woke = _pressure_edge.wait(timeout)
+    _pressure_edge.clear()
+    return woke
+
+def interrupt_pressure_wait():
+    """Wake a thread blocked in wait_for_pressure_change()"""
+    _pressure_edge.set()
+
 def read_float_sensor():
     """
     Read float sensor with thread-safe access.
@@ -145,13 +182,14 @@ def read_float_sensor():
 
 def cleanup_gpio():
     """Clean up GPIO on shutdown"""
-    global _gpio_initialized, _last_pressure_state
+    global _gpio_initialized, _last_pressure_state, _pressure_edge_detect
     
     if GPIO_AVAILABLE and _gpio_initialized:
         try:
             GPIO.cleanup()
             _gpio_initialized = False
             _last_pressure_state = None
+            _pressure_edge_detect = None
         except Exception:
             pass
 
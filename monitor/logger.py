@@ -85,10 +85,11 @@ def migrate_snapshots_csv(filepath):
     except Exception as e:
         print(f'Warning: could not migrate {filepath}: {e}')
 
-def log_event(filepath, event_type, pressure_state, float_state, tank_gallons,
-              tank_depth, tank_percentage, estimated_gallons, relay_status, notes=''):
-    """Log an event to events.csv"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+def format_event_row(event_type, pressure_state, float_state, tank_gallons,
+                     tank_depth, tank_percentage, estimated_gallons, relay_status, notes='',
+                     timestamp=None):
+    """Build an events.csv row (timestamp defaults to now; pass one when writing deferred)"""
+    timestamp = (timestamp or datetime.now()).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
 
     if pressure_state is None:
         pressure_str = 'UNKNOWN'
@@ -97,18 +98,29 @@ def log_event(filepath, event_type, pressure_state, float_state, tank_gallons,
     else:
         pressure_str = 'LOW'
 
+    return [
+        timestamp, event_type, pressure_str, float_state or '',
+        f'{tank_gallons:.0f}' if tank_gallons else '',
+        f'{tank_depth:.2f}' if tank_depth else '',
+        f'{tank_percentage:.1f}' if tank_percentage else '',
+        f'{estimated_gallons:.2f}' if estimated_gallons is not None else '',
+        relay_status.get('bypass', '') if relay_status else '',
+        relay_status.get('supply_override', '') if relay_status else '',
+        notes
+    ]
+
+def append_rows(filepath, rows):
+    """Append a batch of already-formatted rows to a CSV file in one open/write"""
     with open(filepath, 'a', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            timestamp, event_type, pressure_str, float_state or '',
-            f'{tank_gallons:.0f}' if tank_gallons else '',
-            f'{tank_depth:.2f}' if tank_depth else '',
-            f'{tank_percentage:.1f}' if tank_percentage else '',
-            f'{estimated_gallons:.2f}' if estimated_gallons is not None else '',
-            relay_status.get('bypass', '') if relay_status else '',
-            relay_status.get('supply_override', '') if relay_status else '',
-            notes
-        ])
+        csv.writer(f).writerows(rows)
+
+def log_event(filepath, event_type, pressure_state, float_state, tank_gallons,
+              tank_depth, tank_percentage, estimated_gallons, relay_status, notes=''):
+    """Log an event to events.csv"""
+    append_rows(filepath, [format_event_row(
+        event_type, pressure_state, float_state, tank_gallons,
+        tank_depth, tank_percentage, estimated_gallons, relay_status, notes
+    )])
 
 def log_snapshot(filepath, duration, tank_gallons, tank_gallons_delta, tank_data_age,
                 float_state, float_ever_calling, float_always_full,
@@ -117,9 +129,10 @@ def log_snapshot(filepath, duration, tank_gallons, tank_gallons_delta, tank_data
                 outdoor_temp=None, indoor_temp=None, outdoor_humidity=None,
                 baro_abs=None, wind_gust=None, tank_rolling_gph=None,
                 vehicle_count=None, dosatron_gallons=None,
-                bypass_gallons=None, gallons_in=None, gallons_used=None):
-    """Log a snapshot to snapshots.csv"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+                bypass_gallons=None, gallons_in=None, gallons_used=None,
+                timestamp=None):
+    """Log a snapshot to snapshots.csv (timestamp defaults to now; pass one when writing deferred)"""
+    timestamp = (timestamp or datetime.now()).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
 
     # Format tank_gallons_delta with explicit sign (+0, -N, +N)
     if tank_gallons_delta is not None:
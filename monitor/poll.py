@@ -4,10 +4,12 @@ Simplified event-based polling loop
 import csv
 import json
 import os
+import queue
 import shutil
 import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import signal
 
@@ -36,12 +38,16 @@ from monitor.config import (
     NOTIFY_VEHICLE_DETECTED,
 )
 from monitor.gpio_helpers import (
-    read_pressure, read_float_sensor,
+    read_pressure, read_float_sensor, wait_for_pressure_change, interrupt_pressure_wait,
     FLOAT_STATE_FULL, FLOAT_STATE_CALLING
 )
 from monitor.tank import get_tank_data
+from monitor.relay import (
+    init_relays, restore_relay_states, cleanup_relays, purge_spindown_filter, abort_purge,
+    clear_purge_abort, set_supply_override, get_relay_status as read_relay_status
+)
 from monitor.ambient_weather import get_weather_data
-from monitor.logger import log_event, log_snapshot
+from monitor.logger import format_event_row, append_rows, log_snapshot
 try:
     from monitor.dosatron import count_clicks as _count_dosatron_clicks, GALLONS_PER_CLICK as _DOSATRON_GPK
     _DOSATRON_SIGNAL_FILE = os.path.join(
@@ -112,6 +118,25 @@ from monitor.ntfy import send_notification
 from monitor.email_notifier import send_email_notification
 from monitor.occupancy import is_occupied, load_reservations, get_checkout_datetime, get_checkin_datetime, parse_date
 
+# Adaptive tank polling: faster while the pump runs, backing off (x1.5 per quiet
+# poll, up to _TANK_IDLE_MAX_FACTOR x tank_interval) while nothing is changing
+_TANK_ACTIVE_INTERVAL = 60
+_TANK_IDLE_MAX_FACTOR = 4
+_TANK_IDLE_DELTA_GALLONS = 1.0
+
+# events.csv rows are written as soon as they're queued but fsync'd at most this often
+_LOG_SYNC_INTERVAL = 1.0
+
+# Image URLs attached to notifications; DASHBOARD_URL is fixed for the life of the process
+_EPAPER_IMAGE_URL = f"{DASHBOARD_URL}api/epaper.jpg?tenant=no"
+_RING_IMAGE_URL = f"{DASHBOARD_URL}api/ring.jpg"
+
+# Slow disk/network jobs run on the monitor's I/O worker thread (see SimplifiedMonitor._defer_io)
+_IO_HANDLERS = {
+    'snapshot': log_snapshot,
+    'email': send_email_notification,
+}
+
 def _intersect_windows(windows_a, windows_b):
     """Return intersection of two lists of (start, end) intervals."""
     result = []
@@ -124,12 +149,29 @@ def _intersect_windows(windows_a, windows_b):
     return result
 
 
+_hms_cache = (None, '')
+
+def _hms():
+    """Current HH:MM:SS for console output, formatted at most once per second"""
+    global _hms_cache
+    sec = int(time.time())
+    if sec != _hms_cache[0]:
+        _hms_cache = (sec, time.strftime('%H:%M:%S', time.localtime(sec)))
+    return _hms_cache[1]
+
+
+_GALLONS_PER_SECOND = 1.0 / SECONDS_PER_GALLON
+
+def _fmt_gal(gallons):
+    """'123 gal' for console output, or 'Unknown' before the first good tank reading"""
+    return 'Unknown' if gallons is None else f"{gallons:.0f} gal"
+
 def estimate_gallons(duration_seconds):
     """Estimate gallons pumped based on pressure duration"""
     effective_pumping_time = duration_seconds - RESIDUAL_PRESSURE_SECONDS
     if effective_pumping_time <= 0:
         return 0.0
-    return effective_pumping_time / SECONDS_PER_GALLON
+    return effective_pumping_time * _GALLONS_PER_SECOND
 
 def get_next_snapshot_time(current_time, interval_minutes):
     """Return next exact interval boundary (e.g., :00, :15, :30, :45)"""
@@ -259,7 +301,7 @@ class SnapshotTracker:
         bypass_secs = self.bypass_seconds
         if self._bypass_on_since is not None:
             bypass_secs += time.time() - self._bypass_on_since
-        bypass_gallons = bypass_secs / SECONDS_PER_GALLON if bypass_secs > 0 else 0.0
+        bypass_gallons = bypass_secs * _GALLONS_PER_SECOND if bypass_secs > 0 else 0.0
 
         # Pressure-HIGH windows (split at snapshot boundary via reset())
         pressure_windows = list(self.pressure_windows)
@@ -302,6 +344,7 @@ class SimplifiedMonitor:
         self.debug = debug
         self.poll_interval = poll_interval
         self.tank_interval = tank_interval
+        self._effective_tank_interval = tank_interval
         self.snapshot_interval = snapshot_interval
         
         self.running = True
@@ -311,12 +354,16 @@ class SimplifiedMonitor:
         # Pressure tracking
         self.last_pressure_state = None
         self.pressure_high_start = None
+        self._pressure_high_mono = None  # monotonic twin of pressure_high_start, for the duration
         self.last_pressure_high_end_time = None  # when pressure last dropped LOW (for gap detection)
         self._float_calling_at_pressure_high = False
         self._init_last_pressure_high_end_time()
         
         # Timing
         self.last_tank_check = 0
+        # Tank page fetches run here so the HTTP round trip doesn't stall pressure polling
+        self._tank_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tank-fetch')
+        self._tank_future = None
         self.tank_last_updated = None
         self.next_snapshot_time = None
         self.next_daily_status_time = None
@@ -334,7 +381,7 @@ class SimplifiedMonitor:
         # Tank fetch failure tracking
         self.tank_fetch_failures = 0
         self.max_tank_failures = MAX_TANK_FETCH_FAILURES
-        self.tank_outage_start = None  # Track when tank data became unavailable
+        self.tank_outage_start = None  # Track when tank data became unavailable (monotonic)
 
         # Vehicle count tracking (for change detection when unoccupied)
         self.last_vehicle_count = None
@@ -345,7 +392,7 @@ class SimplifiedMonitor:
 
         # TANK_LEVEL enrichment: track dosatron gallons and bypass seconds between events
         self._last_tank_level_time: float = time.time()
-        self._bypass_on_since: float | None = None
+        self._bypass_on_since: float | None = None  # monotonic
         self._bypass_accumulated_secs: float = 0.0
         # Only count dosatron clicks during pressure-HIGH windows (avoids noise when pump is off)
         self._pressure_windows_since_tank_level: list = []
@@ -364,6 +411,7 @@ class SimplifiedMonitor:
         self.enable_purge = ENABLE_PURGE
         self.min_purge_interval = MIN_PURGE_INTERVAL
         self.last_purge_time = 0
+        self._purge_thread = None  # background purge (at most one at a time), joined on shutdown
 
         # Override shutoff control
         self.enable_override_shutoff = ENABLE_OVERRIDE_SHUTOFF
@@ -383,8 +431,33 @@ class SimplifiedMonitor:
             debug=self.debug
         )
 
+        # Deferred I/O: snapshot appends and status emails run on a worker thread
+        # so slow disk/SMTP calls don't stall pressure polling
+        self._io_queue = queue.SimpleQueue()
+        self._io_thread = threading.Thread(target=self._io_worker, daemon=True, name='monitor-io')
+        self._io_thread.start()
+
+        # Event rows go out on their own writer thread, so a slow email or Ring
+        # fetch on the I/O worker can't hold them back
+        self._log_ring = deque()  # (filepath, row) event lines awaiting the next batch write
+        self._log_lock = threading.Lock()  # guards the handles below and batch writes
+        self._log_handles = {}  # filepath -> append handle
+        self._log_unsynced = set()  # handles written since the last fsync
+        self._last_log_sync = 0.0
+        self._log_wake = threading.Event()
+        self._log_stopping = False
+        self._log_thread = threading.Thread(target=self._log_worker, daemon=True, name='monitor-events')
+        self._log_thread.start()
+
+        # Handlers only set flags. Python writes each caught signal's number to the
+        # wakeup fd, and a watcher thread reports it and ends the loop's pressure wait.
+        self._signal_r, signal_w = os.pipe()
+        os.set_blocking(signal_w, False)
+        signal.set_wakeup_fd(signal_w)
+        threading.Thread(target=self._signal_watcher, daemon=True, name='monitor-signals').start()
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
+        signal.signal(signal.SIGUSR1, self.tank_now_handler)
     
     def _init_last_purge_date(self):
         """Seed last_purge_date from events.csv so restarts don't fire an extra purge today."""
@@ -433,15 +506,125 @@ class SimplifiedMonitor:
         except Exception:
             pass
 
+    def _purge_running(self):
+        """True while a background purge thread (including its start delay) is alive"""
+        return self._purge_thread is not None and self._purge_thread.is_alive()
+
+    def _start_purge(self, target, name):
+        """Run target on a purge thread unless one is already running; returns True if started.
+        One purge at a time: they share the valve pin and the abort event."""
+        if self._purge_running():
+            return False
+        clear_purge_abort()
+        self._purge_thread = threading.Thread(target=target, daemon=True, name=name)
+        self._purge_thread.start()
+        return True
+
+    def _defer_io(self, kind, *args, **kwargs):
+        """Queue a slow disk/network job for the I/O worker thread.
+        kind is an _IO_HANDLERS key or a callable (e.g. a bound method)."""
+        self._io_queue.put((kind, args, kwargs))
+
+    def _io_worker(self):
+        """Run deferred I/O jobs in order until the shutdown sentinel arrives"""
+        while True:
+            job = self._io_queue.get()
+            if job is None:
+                break
+            kind, args, kwargs = job
+            handler = kind if callable(kind) else _IO_HANDLERS[kind]
+            try:
+                handler(*args, **kwargs)
+            except Exception as e:
+                print(f"Deferred {getattr(kind, '__name__', kind)} failed: {e}", flush=True)
+
+    def _log_worker(self):
+        """Batch-write pending event-log lines whenever woken, and sync them to disk
+        once _LOG_SYNC_INTERVAL has passed since the last sync, until shutdown"""
+        while not self._log_stopping:
+            timeout = None
+            if self._log_unsynced:
+                timeout = max(0.0, self._last_log_sync + _LOG_SYNC_INTERVAL - time.monotonic())
+            self._log_wake.wait(timeout)
+            self._log_wake.clear()
+            self._flush_log_ring()
+            self._sync_event_logs()
+
+    def _flush_log_ring(self):
+        """Write all pending event-log lines, one append per file"""
+        with self._log_lock:
+            batches = {}
+            while True:
+                try:
+                    filepath, row = self._log_ring.popleft()
+                except IndexError:
+                    break
+                batches.setdefault(filepath, []).append(row)
+            for filepath, rows in batches.items():
+                try:
+                    f = self._event_log_handle(filepath)
+                    csv.writer(f).writerows(rows)
+                    f.flush()
+                    self._log_unsynced.add(f)
+                except Exception as e:
+                    print(f"Could not write {len(rows)} event(s) to {filepath}: {e}", flush=True)
+
+    def _sync_event_logs(self, force=False):
+        """fsync written event logs so a power cut on the Pi doesn't lose events the
+        loop already considers logged; bursts share one fsync per _LOG_SYNC_INTERVAL"""
+        with self._log_lock:
+            if not self._log_unsynced:
+                return
+            if not force and time.monotonic() - self._last_log_sync < _LOG_SYNC_INTERVAL:
+                return
+            for f in self._log_unsynced:
+                try:
+                    os.fsync(f.fileno())
+                except Exception as e:
+                    print(f"Could not sync {f.name}: {e}", flush=True)
+            self._log_unsynced.clear()
+            self._last_log_sync = time.monotonic()
+
+    def _event_log_handle(self, filepath):
+        """Append handle kept open across batches; reopened if the file was removed or replaced.
+        Caller holds _log_lock."""
+        f = self._log_handles.get(filepath)
+        if f is not None:
+            try:
+                if os.stat(filepath).st_ino == os.fstat(f.fileno()).st_ino:
+                    return f
+            except OSError:
+                pass
+            self._log_unsynced.discard(f)
+            f.close()
+        f = self._log_handles[filepath] = open(filepath, 'a', newline='')
+        return f
+
     def signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
-        if self.debug:
-            print(f"\nReceived signal {signum}, shutting down...")
         self.running = False
     
+    def tank_now_handler(self, signum, frame):
+        """SIGUSR1: poll the tank on the next loop pass (e.g. systemctl kill -s USR1 pumphouse-monitor)"""
+        self.last_tank_check = float('-inf')
+
+    def _signal_watcher(self):
+        """Report signals arriving on the wakeup fd and cut the loop's pressure wait short.
+        Runs off the main thread, so it can't deadlock on a lock the handler interrupted."""
+        while True:
+            signums = os.read(self._signal_r, 64)
+            if not signums:
+                break
+            if self.debug:
+                for signum in signums:
+                    if signum == signal.SIGUSR1:
+                        print("\nReceived SIGUSR1, polling tank now")
+                    else:
+                        print(f"\nReceived signal {signum}, shutting down...")
+            interrupt_pressure_wait()
+
     def enable_relay_control(self):
         """Enable relay control and restore saved states"""
-        from monitor.relay import init_relays, restore_relay_states
         if init_relays():
             self.relay_control_enabled = True
             if self.debug:
@@ -468,13 +651,15 @@ class SimplifiedMonitor:
     def get_relay_status(self):
         """Get current relay status"""
         if self.relay_control_enabled:
-            from monitor.relay import get_relay_status
-            return get_relay_status()
+            return read_relay_status()
         return {'bypass': 'OFF', 'supply_override': 'OFF'}
     
     def fetch_tank_data(self):
         """Fetch and update tank data"""
-        data = get_tank_data(self.tank_url)
+        return self.apply_tank_data(get_tank_data(self.tank_url))
+
+    def apply_tank_data(self, data):
+        """Update state from a get_tank_data() result; returns True if it was a good reading"""
         if data['status'] == 'success':
             self.state.update_tank(
                 data['depth'],
@@ -492,6 +677,19 @@ class SimplifiedMonitor:
             return True
         return False
 
+    def _adapt_tank_interval(self, fetch_ok, prev_gallons):
+        """Pick the next tank poll interval from pressure, override, and the last level change"""
+        if self.last_pressure_state:
+            self._effective_tank_interval = min(_TANK_ACTIVE_INTERVAL, self.tank_interval)
+        elif (fetch_ok and prev_gallons is not None and self.state.tank_gallons is not None
+              and abs(self.state.tank_gallons - prev_gallons) < _TANK_IDLE_DELTA_GALLONS
+              and self.get_relay_status()['supply_override'] != 'ON'):
+            self._effective_tank_interval = min(self._effective_tank_interval * 1.5,
+                                                self.tank_interval * _TANK_IDLE_MAX_FACTOR)
+        else:
+            # Level moving, override filling, or fetch failing - normal cadence
+            self._effective_tank_interval = self.tank_interval
+
     def fetch_weather_data(self):
         """Fetch and update weather data from Ambient Weather"""
         if not ENABLE_AMBIENT_WEATHER:
@@ -520,6 +718,31 @@ class SimplifiedMonitor:
             return True
         return False
     
+    def _refresh_weather(self):
+        """Weather poll run on the I/O worker so the HTTP call doesn't hold up sensor polling"""
+        if self.fetch_weather_data() and self.debug:
+            print(f"{_hms()} - Weather: "
+                 f"Outdoor {self.state.outdoor_temp}°F, "
+                 f"Indoor {self.state.indoor_temp}°F")
+
+    def get_email_status_snapshot(self):
+        """Tank/sensor readings the monitor already holds, so status emails don't re-fetch them.
+        The float sensor is left out (state only updates on a tank poll and the live GPIO
+        read is cheap), and so is the tank during a fetch outage, so the email reads both fresh."""
+        snapshot = {
+            'pressure': self.last_pressure_state,
+        }
+        if self.state.tank_gallons is not None and self.tank_fetch_failures == 0:
+            snapshot['tank'] = {
+                'status': 'success',
+                'depth': self.state.tank_depth,
+                'percentage': self.state.tank_percentage,
+                'gallons': self.state.tank_gallons,
+                'last_updated': datetime.fromtimestamp(self.tank_last_updated) if self.tank_last_updated else None,
+                'float_state': self.state.float_state,
+            }
+        return snapshot
+
     def get_tank_data_age(self):
         """Get age of tank data in seconds"""
         if self.tank_last_updated:
@@ -530,38 +753,31 @@ class SimplifiedMonitor:
         """Log a pressure event and add to snapshot tracker"""
         # Add to snapshot FIRST before logging
         self.snapshot_tracker.add_estimated_gallons(estimated_gallons)
-        
-        snapshot = self.state.get_snapshot()
-        relay_status = self.get_relay_status()
-        
-        log_event(
-            self.events_file,
-            event_type,
-            self.last_pressure_state,
-            snapshot['float_state'],
-            snapshot['tank_gallons'],
-            snapshot['tank_depth'],
-            snapshot['tank_percentage'],
-            estimated_gallons,
-            relay_status,
-            notes
-        )
+        self._queue_event(event_type, estimated_gallons, notes)
     
     def log_state_event(self, event_type, notes=''):
         """Log a state change event"""
-        snapshot = self.state.get_snapshot()
-        relay_status = self.get_relay_status()
-
-        log_event(
-            self.events_file,
+        self._queue_event(event_type, None, notes)
+
+    def _queue_event(self, event_type, estimated_gallons, notes):
+        """Format an events.csv row from current state and queue it for the event writer"""
+        self._log_ring.append((self.events_file, self._event_row(event_type, estimated_gallons, notes)))
+        # Wake the writer; rows queued before it gets to this go out in the same batch
+        self._log_wake.set()
+
+    def _event_row(self, event_type, estimated_gallons, notes):
+        """events.csv row for the current state"""
+        # Read the four fields straight off state rather than building a full get_snapshot() dict
+        state = self.state
+        return format_event_row(
             event_type,
             self.last_pressure_state,
-            snapshot['float_state'],
-            snapshot['tank_gallons'],
-            snapshot['tank_depth'],
-            snapshot['tank_percentage'],
-            None,
-            relay_status,
+            state.float_state,
+            state.tank_gallons,
+            state.tank_depth,
+            state.tank_percentage,
+            estimated_gallons,
+            self.get_relay_status(),
             notes
         )
 
@@ -577,7 +793,7 @@ class SimplifiedMonitor:
             priority=priority,
             tags=['droplet'],
             click_url=DASHBOARD_URL,
-            attach_url=f"{DASHBOARD_URL}api/epaper.jpg?tenant=no",
+            attach_url=_EPAPER_IMAGE_URL,
             debug=self.debug
         )
 
@@ -587,7 +803,7 @@ class SimplifiedMonitor:
             message=message,
             priority=priority,
             dashboard_url=DASHBOARD_URL,
-            chart_url=f"{DASHBOARD_URL}api/epaper.jpg?tenant=no",
+            chart_url=_EPAPER_IMAGE_URL,
             debug=self.debug,
             include_status=True  # Always include full status
         )
@@ -650,8 +866,16 @@ class SimplifiedMonitor:
 
     def run(self):
         """Main monitoring loop"""
+        # Bind attributes that are fixed for the life of the monitor; the loop reads them as locals
+        debug = self.debug
+        state = self.state
+        tracker = self.snapshot_tracker
+        notifications = self.notification_manager
+        poll_interval = self.poll_interval
+
         # Enable relay control for status monitoring
         self.enable_relay_control()
+        relay_enabled = self.relay_control_enabled
 
         # Initial state
         self.last_pressure_state = read_pressure()
@@ -674,7 +898,7 @@ class SimplifiedMonitor:
                 time.time(),
                 DAILY_STATUS_EMAIL_TIME
             )
-            if self.debug:
+            if debug:
                 next_daily_dt = datetime.fromtimestamp(self.next_daily_status_time)
                 print(f"Next daily status email at: {next_daily_dt.strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -684,62 +908,71 @@ class SimplifiedMonitor:
                 time.time(),
                 CHECKOUT_REMINDER_TIME
             )
-            if self.debug:
+            if debug:
                 next_checkout_dt = datetime.fromtimestamp(self.next_checkout_reminder_time)
                 print(f"Next checkout reminder at: {next_checkout_dt.strftime('%Y-%m-%d %H:%M:%S')}")
 
-        if self.debug:
+        if debug:
             next_dt = datetime.fromtimestamp(self.next_snapshot_time)
             print(f"First snapshot at: {next_dt.strftime('%H:%M:%S')}")
             print("Monitoring started...\n")
         
-        self.last_tank_check = time.time()
-        last_float_state = self.state.float_state
+        # Poll timers use the monotonic clock so NTP steps can't stall or burst them
+        self.last_tank_check = time.monotonic()
+        self.last_weather_check = self.last_tank_check
+        last_float_state = state.float_state
         
         try:
             while self.running:
                 current_time = time.time()
+                mono = time.monotonic()
+                today = None  # date for this iteration, built only by branches that need it
                 current_pressure = read_pressure()
                 
                 if current_pressure is None:
-                    time.sleep(self.poll_interval)
+                    time.sleep(max(0.0, mono + poll_interval - time.monotonic()))
                     continue
                 
                 # Update snapshot pressure tracking
-                self.snapshot_tracker.update_pressure(current_pressure)
+                tracker.update_pressure(current_pressure)
                 
                 # PRESSURE STATE CHANGE
                 if current_pressure != self.last_pressure_state:
                     if current_pressure:  # Went HIGH
                         self.pressure_high_start = current_time
+                        self._pressure_high_mono = mono
+                        self._effective_tank_interval = min(_TANK_ACTIVE_INTERVAL, self.tank_interval)
                         self._pressure_high_window_start = current_time
-                        self._float_calling_at_pressure_high = (self.state.float_state == FLOAT_STATE_CALLING)
+                        self._float_calling_at_pressure_high = (state.float_state == FLOAT_STATE_CALLING)
+                        current_gal = state.tank_gallons or 0
                         self.log_state_event('PRESSURE_HIGH')
                         _write_pressure_signal("HIGH", current_time)
-                        if self.debug:
-                            print(f"{datetime.now().strftime('%H:%M:%S')} - Pressure HIGH")
+                        if debug:
+                            print(f"{_hms()} - Pressure HIGH")
 
                         # Purge logic: fire ~15s into this pressure cycle.
                         # Priority 1: externally-scheduled purge (PURGE_PENDING_FILE).
                         # Priority 2: daily once-per-day purge after DAILY_PURGE_HOUR.
                         _purge_reason = None
-                        if PURGE_PENDING_FILE.exists():
+                        if self._purge_running():
+                            pass  # pending request stays queued for a later cycle
+                        elif PURGE_PENDING_FILE.exists():
                             PURGE_PENDING_FILE.unlink(missing_ok=True)
                             _purge_reason = 'Pressure-timed purge (15s into cycle)'
-                        elif (ENABLE_DAILY_PURGE and self.relay_control_enabled
-                              and datetime.now().hour >= DAILY_PURGE_HOUR
-                              and self.last_purge_date != datetime.now().date()):
-                            _purge_reason = 'Daily purge (15s into first cycle after {}am)'.format(DAILY_PURGE_HOUR)
+                        elif (ENABLE_DAILY_PURGE and relay_enabled
+                              and time.localtime(current_time).tm_hour >= DAILY_PURGE_HOUR):
+                            today = today or datetime.fromtimestamp(current_time).date()
+                            if self.last_purge_date != today:
+                                _purge_reason = 'Daily purge (15s into first cycle after {}am)'.format(DAILY_PURGE_HOUR)
                         if _purge_reason:
                             def _delayed_purge(monitor=self, reason=_purge_reason):
                                 time.sleep(15)
-                                from monitor.relay import purge_spindown_filter
-                                if purge_spindown_filter(debug=monitor.debug):
+                                if monitor.running and purge_spindown_filter(debug=monitor.debug):
                                     monitor.log_state_event('PURGE', reason)
                                     monitor.snapshot_tracker.increment_purge()
                                     monitor.last_purge_time = time.time()
                                     monitor.last_purge_date = datetime.now().date()
-                            threading.Thread(target=_delayed_purge, daemon=True, name='purge-timed').start()
+                            self._start_purge(_delayed_purge, 'purge-timed')
 
                         # Compute gap since pressure last dropped LOW (used for both alert + pumpoff rebuild)
                         _gap = (current_time - self.last_pressure_high_end_time
@@ -752,7 +985,6 @@ class SimplifiedMonitor:
                         # Pressure recovery alert: watch is ON + gap >= 4 hours
                         _RECOVERY_GAP = 4 * 3600
                         if PRESSURE_LOW_WATCH_FILE.exists() and (_gap is None or _gap >= _RECOVERY_GAP):
-                            current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
                             self.log_state_event('PRESSURE_RECOVERY', f'Gap: {_gap_str}')
                             send_notification(
                                 title=f"{current_gal:.0f} gal - Pressure HIGH (after {_gap_str} gap)",
@@ -760,8 +992,8 @@ class SimplifiedMonitor:
                                 priority='high',
                                 tags=['droplet', 'white_check_mark'],
                                 click_url=DASHBOARD_URL,
-                                attach_url=f"{DASHBOARD_URL}api/epaper.jpg?tenant=no",
-                                debug=self.debug
+                                attach_url=_EPAPER_IMAGE_URL,
+                                debug=debug
                             )
 
                         # Rebuild pumpoff.csv after a pump outage (gap >= 24h), confirmed by
@@ -784,8 +1016,7 @@ class SimplifiedMonitor:
                                              name='pumpoff-rebuild').start()
 
                         # Send high pressure alert if enabled
-                        if NOTIFY_HIGH_PRESSURE_ENABLED and self.notification_manager.can_notify('high_pressure'):
-                            current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
+                        if NOTIFY_HIGH_PRESSURE_ENABLED and notifications.can_notify('high_pressure'):
 
                             # Send ntfy notification
                             send_notification(
@@ -794,8 +1025,8 @@ class SimplifiedMonitor:
                                 priority='high',
                                 tags=['droplet', 'warning'],
                                 click_url=DASHBOARD_URL,
-                                attach_url=f"{DASHBOARD_URL}api/epaper.jpg?tenant=no",
-                                debug=self.debug
+                                attach_url=_EPAPER_IMAGE_URL,
+                                debug=debug
                             )
 
                             # Optionally send email notification
@@ -805,8 +1036,8 @@ class SimplifiedMonitor:
                                     message=f"Water pressure is HIGH (\u226510 PSI) - someone may be using water",
                                     priority='high',
                                     dashboard_url=DASHBOARD_URL,
-                                    chart_url=f"{DASHBOARD_URL}api/epaper.jpg?tenant=no",
-                                    debug=self.debug,
+                                    chart_url=_EPAPER_IMAGE_URL,
+                                    debug=debug,
                                     include_status=True
                                 )
                     else:  # Went LOW
@@ -817,15 +1048,18 @@ class SimplifiedMonitor:
                                     (self._pressure_high_window_start, current_time)
                                 )
                                 self._pressure_high_window_start = None
-                            duration = current_time - self.pressure_high_start
+                            # Monotonic so an NTP step mid-cycle can't skew the gallon estimate
+                            duration = mono - self._pressure_high_mono
                             estimated = estimate_gallons(duration)
                             dosatron_clicks = _count_dosatron_clicks(self.pressure_high_start, current_time)
                             _dosatron_gal = round(dosatron_clicks * _DOSATRON_GPK, 2)
                             self.log_pressure_event('PRESSURE_LOW', estimated,
                                                     f'Duration: {duration:.1f}s, Dosatron: {_dosatron_gal:.2f} gal ({dosatron_clicks} clicks)')
+                            # The prediction re-reads events.csv; write this cycle's rows first
+                            self._flush_log_ring()
                             _write_pressure_prediction(self.events_file, current_time)
-                            if self.debug:
-                                print(f"{datetime.now().strftime('%H:%M:%S')} - Pressure LOW "
+                            if debug:
+                                print(f"{_hms()} - Pressure LOW "
                                      f"(was HIGH for {duration:.1f}s, ~{estimated:.1f} gal, "
                                      f"{_dosatron_gal:.2f} Dosatron gal ({dosatron_clicks} clicks)")
 
@@ -833,31 +1067,41 @@ class SimplifiedMonitor:
                             # recording captures any trailing clicks before we report the count.
                             _float_ok = (not NOTIFY_PRESSURE_LOW_REQUIRES_FLOAT_CALLING
                                          or self._float_calling_at_pressure_high)
-                            if _float_ok and (NOTIFY_PRESSURE_LOW_ENABLED or PRESSURE_LOW_WATCH_FILE.exists()) and self.notification_manager.can_notify('pressure_low'):
+                            if _float_ok and (NOTIFY_PRESSURE_LOW_ENABLED or PRESSURE_LOW_WATCH_FILE.exists()) and notifications.can_notify('pressure_low'):
                                 self.pending_pressure_low_notif = {
                                     "send_at":    current_time + 30,
                                     "high_start": self.pressure_high_start,
                                     "duration":   duration,
                                     "estimated":  estimated,
-                                    "tank_gal":   self.state.tank_gallons or 0,
+                                    "tank_gal":   state.tank_gallons or 0,
                                 }
 
                             # Trigger purge if enabled AND enough time has passed
-                            if self.enable_purge and self.relay_control_enabled and estimated > 0:
+                            if self.enable_purge and relay_enabled and estimated > 0:
                                 time_since_last_purge = current_time - self.last_purge_time
                                 if time_since_last_purge >= self.min_purge_interval:
-                                    if self.debug:
+                                    if debug:
                                         print("  → Triggering filter purge...")
-                                    from monitor.relay import purge_spindown_filter
-                                    if purge_spindown_filter(debug=self.debug):
-                                        self.log_state_event('PURGE', 'Auto-purge after water delivery')
-                                        self.snapshot_tracker.increment_purge()
-                                        self.last_purge_time = current_time
-                                elif self.debug:
+                                    # Purge off-thread so the loop keeps watching pressure while the
+                                    # valve is open; claim the interval now, give it back on failure
+                                    prev_purge_time = self.last_purge_time
+                                    def _auto_purge(monitor=self, prev_purge_time=prev_purge_time):
+                                        if purge_spindown_filter(debug=monitor.debug):
+                                            monitor.log_state_event('PURGE', 'Auto-purge after water delivery')
+                                            monitor.snapshot_tracker.increment_purge()
+                                        else:
+                                            monitor.last_purge_time = prev_purge_time
+                                    self.last_purge_time = current_time
+                                    if not self._start_purge(_auto_purge, 'purge-auto'):
+                                        self.last_purge_time = prev_purge_time
+                                        if debug:
+                                            print("  → Skipping purge (another purge is running)")
+                                elif debug:
                                     mins_to_wait = int((self.min_purge_interval - time_since_last_purge) / 60)
                                     print(f"  → Skipping purge (min interval not met, wait {mins_to_wait} more min)")
 
                         self.pressure_high_start = None
+                        self._pressure_high_mono = None
                         self.last_pressure_high_end_time = current_time
 
                     self.last_pressure_state = current_pressure
@@ -878,14 +1122,26 @@ class SimplifiedMonitor:
                         priority='default',
                         tags=['droplet'],
                         click_url=DASHBOARD_URL,
-                        attach_url=f"{DASHBOARD_URL}api/epaper.jpg?tenant=no",
-                        debug=self.debug,
+                        attach_url=_EPAPER_IMAGE_URL,
+                        debug=debug,
                     )
 
-                # TANK POLLING
-                if current_time - self.last_tank_check >= self.tank_interval:
-                    prev_gallons = self.state.tank_gallons
-                    tank_fetch_success = self.fetch_tank_data()
+                # TANK POLLING - start the fetch when due, process it on the first
+                # iteration after it completes
+                if self._tank_future is None and mono - self.last_tank_check >= self._effective_tank_interval:
+                    self._tank_future = self._tank_executor.submit(get_tank_data, self.tank_url)
+                    # Wake the pressure wait when the result lands instead of a poll later
+                    self._tank_future.add_done_callback(lambda _f: interrupt_pressure_wait())
+                    self.last_tank_check = mono
+                if self._tank_future is not None and self._tank_future.done():
+                    try:
+                        tank_data = self._tank_future.result()
+                    except Exception as e:
+                        tank_data = {'status': 'error', 'error_message': str(e)}
+                    self._tank_future = None
+                    prev_gallons = state.tank_gallons
+                    tank_fetch_success = self.apply_tank_data(tank_data)
+                    self._adapt_tank_interval(tank_fetch_success, prev_gallons)
 
                     # Track consecutive failures
                     if not tank_fetch_success:
@@ -893,21 +1149,21 @@ class SimplifiedMonitor:
 
                         # Mark outage start time on first failure
                         if self.tank_fetch_failures == 1 and self.tank_outage_start is None:
-                            self.tank_outage_start = current_time
-                            if self.debug:
-                                print(f"  Tank outage started at {datetime.fromtimestamp(current_time).strftime('%Y-%m-%d %H:%M:%S')}")
+                            self.tank_outage_start = mono
+                            if debug:
+                                print(f"  Tank outage started at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(current_time))}")
 
-                        if self.debug:
+                        if debug:
                             print(f"  Tank fetch failed ({self.tank_fetch_failures}/{self.max_tank_failures})")
                     else:
                         # Success - check if recovering from outage
                         if self.tank_fetch_failures > 0:
-                            if self.debug:
+                            if debug:
                                 print(f"  Tank fetch recovered (was {self.tank_fetch_failures} failures)")
 
                             # Calculate outage duration
                             if self.tank_outage_start is not None:
-                                outage_duration_seconds = current_time - self.tank_outage_start
+                                outage_duration_seconds = mono - self.tank_outage_start
                                 outage_duration_minutes = outage_duration_seconds / 60
 
                                 # Log outage recovery event
@@ -924,19 +1180,18 @@ class SimplifiedMonitor:
                         self.tank_fetch_failures = 0
 
                     # SAFETY: Turn off override only after multiple consecutive failures
-                    if self.tank_fetch_failures >= self.max_tank_failures and self.relay_control_enabled:
+                    if self.tank_fetch_failures >= self.max_tank_failures and relay_enabled:
                         relay_status = self.get_relay_status()
                         if relay_status['supply_override'] == 'ON':
-                            if self.debug:
+                            if debug:
                                 print(f"  → SAFETY: Cannot read tank level after {self.tank_fetch_failures} attempts, turning off override to prevent overflow")
 
-                            from monitor.relay import set_supply_override
-                            if set_supply_override('OFF', debug=self.debug):
+                            if set_supply_override('OFF', debug=debug):
                                 self.log_state_event('OVERRIDE_SHUTOFF',
                                     f'Safety shutoff: cannot read tank level after {self.tank_fetch_failures} attempts (possible internet outage)')
 
                                 # Send urgent notification
-                                if NOTIFY_OVERRIDE_SHUTOFF and self.notification_manager.can_notify('override_shutoff_safety'):
+                                if NOTIFY_OVERRIDE_SHUTOFF and notifications.can_notify('override_shutoff_safety'):
                                     self.send_alert(
                                         'NOTIFY_OVERRIDE_OFF',
                                         f"⚠️ Override OFF - Tank Unreadable",
@@ -949,7 +1204,7 @@ class SimplifiedMonitor:
 
                     if tank_fetch_success:
                         # Track float-CALLING windows for TANK_LEVEL dosatron counting
-                        if self.state.float_state == FLOAT_STATE_CALLING:
+                        if state.float_state == FLOAT_STATE_CALLING:
                             if self._float_calling_window_start_tl is None:
                                 self._float_calling_window_start_tl = current_time
                         elif self._float_calling_window_start_tl is not None:
@@ -958,9 +1213,9 @@ class SimplifiedMonitor:
                             )
                             self._float_calling_window_start_tl = None
                         # Log tank level change
-                        if prev_gallons and self.state.tank_gallons:
-                            if abs(self.state.tank_gallons - prev_gallons) > 0.1:
-                                delta = self.state.tank_gallons - prev_gallons
+                        if prev_gallons and state.tank_gallons:
+                            if abs(state.tank_gallons - prev_gallons) > 0.1:
+                                delta = state.tank_gallons - prev_gallons
                                 # Count clicks only during pressure-HIGH AND float-CALLING overlap
                                 _pressure_wins = list(self._pressure_windows_since_tank_level)
                                 if self._pressure_high_window_start is not None:
@@ -975,7 +1230,7 @@ class SimplifiedMonitor:
                                 _dosa_gal = _dosa_clicks * _DOSATRON_GPK
                                 _bypass_secs = self._bypass_accumulated_secs
                                 if self._bypass_on_since is not None:
-                                    _bypass_secs += current_time - self._bypass_on_since
+                                    _bypass_secs += mono - self._bypass_on_since
 
                                 # Skip sub-8-gal noise when no flow was detected; let state
                                 # accumulate so the next real event gets the full picture.
@@ -991,7 +1246,7 @@ class SimplifiedMonitor:
                                     self._last_tank_level_time = current_time
                                     self._bypass_accumulated_secs = 0.0
                                     if self._bypass_on_since is not None:
-                                        self._bypass_on_since = current_time
+                                        self._bypass_on_since = mono
                                     self._pressure_windows_since_tank_level.clear()
                                     if self._pressure_high_window_start is not None:
                                         self._pressure_high_window_start = current_time
@@ -1002,8 +1257,8 @@ class SimplifiedMonitor:
                                     # Notify on significant tank increase
                                     if (NOTIFY_TANK_LEVEL_MIN_INCREASE is not None
                                             and delta >= NOTIFY_TANK_LEVEL_MIN_INCREASE
-                                            and self.notification_manager.can_notify('tank_level_increase')):
-                                        current_gal = self.state.tank_gallons
+                                            and notifications.can_notify('tank_level_increase')):
+                                        current_gal = state.tank_gallons
                                         _msg = f"Tank gained {delta:.0f} gal"
                                         if _dosa_gal > 0:
                                             _msg += f" ({_dosa_gal:.2f} gal from dosatron, {_dosa_clicks} clicks)"
@@ -1015,18 +1270,18 @@ class SimplifiedMonitor:
                                             _msg
                                         )
 
-                                if self.debug:
-                                    print(f"{datetime.now().strftime('%H:%M:%S')} - "
-                                         f"Tank: {self.state.tank_gallons:.0f} gal "
+                                if debug:
+                                    print(f"{_hms()} - "
+                                         f"Tank: {state.tank_gallons:.0f} gal "
                                          f"({delta:+.1f})")
 
                                 # Check for threshold crossings
-                                crossings = self.notification_manager.check_tank_threshold_crossing(
-                                    self.state.tank_gallons, prev_gallons
+                                crossings = notifications.check_tank_threshold_crossing(
+                                    state.tank_gallons, prev_gallons
                                 )
                                 for direction, level in crossings:
-                                    if self.notification_manager.can_notify(f'tank_{direction}_{level}'):
-                                        current_gal = self.state.tank_gallons
+                                    if notifications.can_notify(f'tank_{direction}_{level}'):
+                                        current_gal = state.tank_gallons
                                         if direction == 'decreasing':
                                             title = f"{current_gal:.0f} gal - Tank < {level}"
                                             msg = f"Tank is now < {level} gallons (currently at {current_gal:.0f} gal)"
@@ -1043,34 +1298,34 @@ class SimplifiedMonitor:
                                         )
                         
                         # Check for float state change
-                        if self.state.float_state != last_float_state:
-                            if self.state.float_state == FLOAT_STATE_CALLING:
+                        if state.float_state != last_float_state:
+                            if state.float_state == FLOAT_STATE_CALLING:
                                 self.log_state_event('FLOAT_CALLING', '⚠️ Tank calling for water!')
-                                if self.debug:
-                                    print(f"{datetime.now().strftime('%H:%M:%S')} - "
+                                if debug:
+                                    print(f"{_hms()} - "
                                          f"⚠️  FLOAT CALLING FOR WATER!")
                             else:
                                 self.log_state_event('FLOAT_FULL', 'Tank full')
-                                if self.debug:
-                                    print(f"{datetime.now().strftime('%H:%M:%S')} - "
+                                if debug:
+                                    print(f"{_hms()} - "
                                          f"Float: Tank full")
-                            last_float_state = self.state.float_state
+                            last_float_state = state.float_state
 
                         # Check for float confirmation (CALLING→FULL for N consecutive readings)
                         # Backup alert if override is disabled or already off
-                        if self.notification_manager.check_float_confirmation(self.state.float_state):
-                            current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
-                            if (self.notification_manager.can_notify('tank_full') and
-                                not self.notification_manager.should_suppress_tank_full(current_gal)):
+                        if notifications.check_float_confirmation(state.float_state):
+                            current_gal = state.tank_gallons or 0
+                            if (notifications.can_notify('tank_full') and
+                                not notifications.should_suppress_tank_full(current_gal)):
                                 self.send_alert(
                                     'NOTIFY_TANK_FULL',
                                     f"{current_gal:.0f} gal - Tank Full",
                                     "Float sensor confirmed FULL for 3+ readings"
                                 )
-                                self.notification_manager.record_tank_full_alert(current_gal)
+                                notifications.record_tank_full_alert(current_gal)
 
                         # Check for override auto-on (continuous enforcement)
-                        if self.override_on_threshold is not None and self.relay_control_enabled:
+                        if self.override_on_threshold is not None and relay_enabled:
                             # Re-read config to allow runtime threshold changes
                             from monitor import config
                             import importlib
@@ -1080,33 +1335,32 @@ class SimplifiedMonitor:
                             if self.override_on_threshold is not None:
                                 relay_status = self.get_relay_status()
                                 if (relay_status['supply_override'] == 'OFF' and
-                                    self.state.tank_gallons is not None and
-                                    self.state.tank_gallons < self.override_on_threshold and
+                                    state.tank_gallons is not None and
+                                    state.tank_gallons < self.override_on_threshold and
                                     not OVERRIDE_MANUAL_OFF_FILE.exists()):
 
-                                    if self.debug:
-                                        print(f"  → Tank at {self.state.tank_gallons} gal (< {self.override_on_threshold}), turning on override...")
+                                    if debug:
+                                        print(f"  → Tank at {state.tank_gallons} gal (< {self.override_on_threshold}), turning on override...")
 
-                                    from monitor.relay import set_supply_override
-                                    if set_supply_override('ON', debug=self.debug):
+                                    if set_supply_override('ON', debug=debug):
                                         self.log_state_event('OVERRIDE_AUTO_ON',
-                                            f'Auto-on: tank at {self.state.tank_gallons:.0f} gal (threshold: {self.override_on_threshold})')
+                                            f'Auto-on: tank at {state.tank_gallons:.0f} gal (threshold: {self.override_on_threshold})')
 
                                         # Seed dosatron safety shutoff tracking
                                         self._override_on_time = current_time
-                                        self._override_on_tank_gallons = self.state.tank_gallons
+                                        self._override_on_tank_gallons = state.tank_gallons
 
                                         # Send notification
-                                        if NOTIFY_OVERRIDE_SHUTOFF and self.notification_manager.can_notify('override_auto_on'):
+                                        if NOTIFY_OVERRIDE_SHUTOFF and notifications.can_notify('override_auto_on'):
                                             self.send_alert(
                                                 'NOTIFY_OVERRIDE_ON',
-                                                f"{self.state.tank_gallons:.0f} gal - Override ON",
-                                                f"Tank dropped to {self.state.tank_gallons:.0f} gal (threshold: {self.override_on_threshold}), override turned on",
+                                                f"{state.tank_gallons:.0f} gal - Override ON",
+                                                f"Tank dropped to {state.tank_gallons:.0f} gal (threshold: {self.override_on_threshold}), override turned on",
                                                 priority='default'
                                             )
 
                         # Check for override shutoff (continuous enforcement)
-                        if self.enable_override_shutoff and self.relay_control_enabled:
+                        if self.enable_override_shutoff and relay_enabled:
                             # Re-read config to allow runtime threshold changes
                             from monitor import config
                             import importlib
@@ -1116,65 +1370,60 @@ class SimplifiedMonitor:
 
                             relay_status = self.get_relay_status()
                             if (relay_status['supply_override'] == 'ON' and
-                                self.state.tank_gallons is not None and
-                                self.state.tank_gallons >= self.override_shutoff_threshold):
+                                state.tank_gallons is not None and
+                                state.tank_gallons >= self.override_shutoff_threshold):
 
-                                if self.debug:
-                                    print(f"  → Tank at {self.state.tank_gallons} gal (>= {self.override_shutoff_threshold}), turning off override...")
+                                if debug:
+                                    print(f"  → Tank at {state.tank_gallons} gal (>= {self.override_shutoff_threshold}), turning off override...")
 
-                                from monitor.relay import set_supply_override
-                                if set_supply_override('OFF', debug=self.debug):
+                                if set_supply_override('OFF', debug=debug):
                                     # Natural fill cycle completed — clear manual-off flag so
                                     # auto-on resumes normally next time tank drops
                                     OVERRIDE_MANUAL_OFF_FILE.unlink(missing_ok=True)
                                     self.log_state_event('OVERRIDE_SHUTOFF',
-                                        f'Auto-shutoff: tank at {self.state.tank_gallons:.0f} gal (threshold: {self.override_shutoff_threshold})')
+                                        f'Auto-shutoff: tank at {state.tank_gallons:.0f} gal (threshold: {self.override_shutoff_threshold})')
 
                                     # Send consolidated tank full notification (primary method)
                                     # Only alert if not suppressed (tank must drop below 90% to re-alert)
                                     if (NOTIFY_OVERRIDE_SHUTOFF and 
-                                        self.notification_manager.can_notify('tank_full') and
-                                        not self.notification_manager.should_suppress_tank_full(self.state.tank_gallons)):
+                                        notifications.can_notify('tank_full') and
+                                        not notifications.should_suppress_tank_full(state.tank_gallons)):
                                         self.send_alert(
                                             'NOTIFY_TANK_FULL',
-                                            f"{self.state.tank_gallons:.0f} gal - Tank Full",
-                                            f"Tank reached {self.state.tank_gallons:.0f} gal (threshold: {self.override_shutoff_threshold}), override turned off",
+                                            f"{state.tank_gallons:.0f} gal - Tank Full",
+                                            f"Tank reached {state.tank_gallons:.0f} gal (threshold: {self.override_shutoff_threshold}), override turned off",
                                             priority='high'
                                         )
-                                        self.notification_manager.record_tank_full_alert(self.state.tank_gallons)
-
-                    self.last_tank_check = current_time
+                                        notifications.record_tank_full_alert(state.tank_gallons)
 
                     # Update bypass accumulators (TANK_LEVEL notes + snapshot)
                     _bypass_rs = self.get_relay_status()
                     _bypass_is_on = _bypass_rs.get('bypass') == 'ON'
                     if _bypass_is_on:
                         if self._bypass_on_since is None:
-                            self._bypass_on_since = current_time
+                            self._bypass_on_since = mono
                     elif self._bypass_on_since is not None:
-                        self._bypass_accumulated_secs += current_time - self._bypass_on_since
+                        self._bypass_accumulated_secs += mono - self._bypass_on_since
                         self._bypass_on_since = None
-                    self.snapshot_tracker.update_bypass(_bypass_is_on)
+                    tracker.update_bypass(_bypass_is_on)
 
                 # WEATHER POLLING
-                if ENABLE_AMBIENT_WEATHER and current_time - self.last_weather_check >= self.weather_interval:
-                    weather_fetch_success = self.fetch_weather_data()
-                    if weather_fetch_success and self.debug:
-                        print(f"{datetime.now().strftime('%H:%M:%S')} - Weather: "
-                             f"Outdoor {self.state.outdoor_temp}°F, "
-                             f"Indoor {self.state.indoor_temp}°F")
-                    self.last_weather_check = current_time
+                if ENABLE_AMBIENT_WEATHER and mono - self.last_weather_check >= self.weather_interval:
+                    self._defer_io(self._refresh_weather)
+                    self.last_weather_check = mono
+
+                # Tank level for the alert titles below; read once after tank polling may have updated it
+                current_gal = state.tank_gallons or 0
 
                 # SNAPSHOT
                 if current_time >= self.next_snapshot_time:
                     # Check for well status (recovery or dry)
-                    refill_status = self.notification_manager.check_refill_status()
+                    refill_status = notifications.check_refill_status()
                     if refill_status:
                         status_type, value = refill_status
                         if (status_type == 'recovery' and 
-                            self.notification_manager.can_notify('well_recovery') and
-                            not self.notification_manager.should_suppress_well_recovery()):
-                            current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
+                            notifications.can_notify('well_recovery') and
+                            not notifications.should_suppress_well_recovery()):
                             # value is the stagnation start timestamp
                             stagnation_end_ts = value + timedelta(hours=NOTIFY_WELL_RECOVERY_STAGNATION_HOURS)
                             stagnation_end_str = stagnation_end_ts.strftime('%a %I:%M %p').replace(' 0', ' ')
@@ -1184,8 +1433,7 @@ class SimplifiedMonitor:
                                 f"Tank gained {NOTIFY_WELL_RECOVERY_THRESHOLD}+ gallons after stagnation period ended {stagnation_end_str}"
                             )
 
-                        elif status_type == 'dry' and self.notification_manager.can_notify('well_dry'):
-                            current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
+                        elif status_type == 'dry' and notifications.can_notify('well_dry'):
                             self.send_alert(
                                 'NOTIFY_WELL_DRY',
                                 f"{current_gal:.0f} gal - Well May Be Dry",
@@ -1195,11 +1443,10 @@ class SimplifiedMonitor:
                             )
 
                     # Check for high flow rate (fast fill mode)
-                    high_flow_status = self.notification_manager.check_high_flow_status()
+                    high_flow_status = notifications.check_high_flow_status()
                     if high_flow_status:
                         status_type, gph = high_flow_status
-                        if status_type == 'high_flow' and self.notification_manager.can_notify('high_flow'):
-                            current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
+                        if status_type == 'high_flow' and notifications.can_notify('high_flow'):
                             self.send_alert(
                                 'NOTIFY_HIGH_FLOW',
                                 f"{current_gal:.0f} gal - High Flow {gph:.0f} GPH",
@@ -1208,11 +1455,10 @@ class SimplifiedMonitor:
                             )
 
                     # Check for backflush event
-                    backflush_status = self.notification_manager.check_backflush_status()
+                    backflush_status = notifications.check_backflush_status()
                     if backflush_status:
                         status_type, gallons_used, backflush_ts = backflush_status
-                        if status_type == 'backflush' and self.notification_manager.can_notify('backflush'):
-                            current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
+                        if status_type == 'backflush' and notifications.can_notify('backflush'):
                             backflush_time_str = backflush_ts.strftime('%a %I:%M %p').replace(' 0', ' ')
                             self.send_alert(
                                 'NOTIFY_BACKFLUSH',
@@ -1222,10 +1468,12 @@ class SimplifiedMonitor:
                             )
 
                     # Check for full-flow event (pressure ~100% continuously)
-                    full_flow_status = self.notification_manager.check_full_flow_status()
+                    full_flow_status = notifications.check_full_flow_status()
                     if full_flow_status and full_flow_status.get('type') == 'full_flow':
-                        if self.notification_manager.can_notify('full_flow'):
-                            current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
+                        if notifications.can_notify('full_flow'):
+                            ff_pumped = full_flow_status['total_gallons_pumped']
+                            ff_gain = full_flow_status['tank_gain']
+                            ff_gph = full_flow_status['estimated_gph']
                             duration_hours = full_flow_status['duration_minutes'] / 60
                             start_time_str = full_flow_status['start_ts'].strftime('%a %I:%M %p').replace(' 0', ' ')
 
@@ -1234,9 +1482,9 @@ class SimplifiedMonitor:
                                 'FULL_FLOW',
                                 notes=f"Full-flow period detected. Started: {start_time_str}, "
                                       f"Duration: {duration_hours:.1f}h, "
-                                      f"Pumped: {full_flow_status['total_gallons_pumped']:.0f} gal, "
-                                      f"Tank gain: {full_flow_status['tank_gain']:+.0f} gal, "
-                                      f"Est. GPH: {full_flow_status['estimated_gph']:.1f}"
+                                      f"Pumped: {ff_pumped:.0f} gal, "
+                                      f"Tank gain: {ff_gain:+.0f} gal, "
+                                      f"Est. GPH: {ff_gph:.1f}"
                             )
 
                             # Send notification
@@ -1244,15 +1492,14 @@ class SimplifiedMonitor:
                                 'NOTIFY_FULL_FLOW',
                                 f"{current_gal:.0f} gal - Full Flow Active",
                                 f"System running at full capacity since {start_time_str} ({duration_hours:.1f}h). "
-                                f"Pumped {full_flow_status['total_gallons_pumped']:.0f} gal "
-                                f"(tank {full_flow_status['tank_gain']:+.0f} gal, ~{full_flow_status['estimated_gph']:.0f} GPH)",
+                                f"Pumped {ff_pumped:.0f} gal "
+                                f"(tank {ff_gain:+.0f} gal, ~{ff_gph:.0f} GPH)",
                                 priority='default'
                             )
 
                     # Secondary full-flow detection via GPH surge (bypass-independent)
-                    bypass_ff = self.notification_manager.check_bypass_full_flow_status()
-                    if bypass_ff and self.notification_manager.can_notify('full_flow_bypass'):
-                        current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
+                    bypass_ff = notifications.check_bypass_full_flow_status()
+                    if bypass_ff and notifications.can_notify('full_flow_bypass'):
                         gph_1h   = bypass_ff['gph_last_1h']
                         gph_prev = bypass_ff['gph_prev_1h']
                         self.log_state_event(
@@ -1269,23 +1516,23 @@ class SimplifiedMonitor:
                         )
 
                     tank_data_age = self.get_tank_data_age()
-                    snapshot_data = self.snapshot_tracker.get_snapshot_data(
-                        self.state.tank_gallons,
+                    snapshot_data = tracker.get_snapshot_data(
+                        state.tank_gallons,
                         tank_data_age,
-                        self.state.float_state,
+                        state.float_state,
                         self.get_relay_status()
                     )
 
                     # Calculate tank gallons delta
                     tank_gallons_delta = None
-                    if self.state.tank_gallons is not None and self.last_snapshot_tank_gallons is not None:
-                        tank_gallons_delta = self.state.tank_gallons - self.last_snapshot_tank_gallons
+                    if state.tank_gallons is not None and self.last_snapshot_tank_gallons is not None:
+                        tank_gallons_delta = state.tank_gallons - self.last_snapshot_tank_gallons
 
                     # Rolling tank GPH (positive = filling, negative = consuming)
                     tank_rolling_gph = None
-                    if self.state.tank_gallons is not None:
+                    if state.tank_gallons is not None:
                         now_ts = time.time()
-                        self._tank_gph_buffer.append((now_ts, self.state.tank_gallons))
+                        self._tank_gph_buffer.append((now_ts, state.tank_gallons))
                         cutoff = now_ts - 7200  # 2-hour window
                         while len(self._tank_gph_buffer) > 1 and self._tank_gph_buffer[0][0] < cutoff:
                             self._tank_gph_buffer.popleft()
@@ -1304,7 +1551,7 @@ class SimplifiedMonitor:
                         if occupancy['occupied']:
                             occupied_status = 'YES'
                     except Exception as e:
-                        if self.debug:
+                        if debug:
                             print(f"Could not check occupancy: {e}")
 
                     # Vehicle count: daytime only; fetch a fresh Ring snapshot (uses cache if still fresh)
@@ -1360,15 +1607,15 @@ class SimplifiedMonitor:
                         if delta > 0:
                             self.log_state_event('VEHICLE_DETECTED',
                                 f'Vehicle count {self.last_vehicle_count}→{snapshot_vehicle_count}{_conf_str} at unoccupied property')
-                            if self.notification_manager.can_notify('vehicle_detected'):
+                            if notifications.can_notify('vehicle_detected'):
                                 send_notification(
                                     title=f'🚗 Vehicle arrived ({self.last_vehicle_count}→{snapshot_vehicle_count})',
                                     message=f'Vehicle count increased to {snapshot_vehicle_count} while property is unoccupied.',
                                     priority='high',
                                     tags=['car'],
                                     click_url=DASHBOARD_URL,
-                                    attach_url=f'{DASHBOARD_URL}api/ring.jpg',
-                                    debug=self.debug
+                                    attach_url=_RING_IMAGE_URL,
+                                    debug=debug
                                 )
                                 if self.last_vehicle_count == 0:
                                     send_email_notification(
@@ -1376,21 +1623,21 @@ class SimplifiedMonitor:
                                         message=f'Vehicle count increased from 0 to {snapshot_vehicle_count}.',
                                         priority='high',
                                         dashboard_url=DASHBOARD_URL,
-                                        debug=self.debug,
+                                        debug=debug,
                                         include_ring_snapshot=True,
                                     )
                         else:
                             self.log_state_event('VEHICLE_DEPARTED',
                                 f'Vehicle count {self.last_vehicle_count}→{snapshot_vehicle_count}{_conf_str} at unoccupied property')
-                            if self.notification_manager.can_notify('vehicle_departed'):
+                            if notifications.can_notify('vehicle_departed'):
                                 send_notification(
                                     title=f'🚗 Vehicle left ({self.last_vehicle_count}→{snapshot_vehicle_count})',
                                     message=f'Vehicle count decreased to {snapshot_vehicle_count} while property is unoccupied.',
                                     priority='default',
                                     tags=['car'],
                                     click_url=DASHBOARD_URL,
-                                    attach_url=f'{DASHBOARD_URL}api/ring.jpg',
-                                    debug=self.debug
+                                    attach_url=_RING_IMAGE_URL,
+                                    debug=debug
                                 )
                     if snapshot_vehicle_count is not None:
                         self.last_vehicle_count = snapshot_vehicle_count
@@ -1407,7 +1654,8 @@ class SimplifiedMonitor:
                         if tank_gallons_delta is not None
                         else _gallons_in
                     )
-                    log_snapshot(
+                    self._defer_io(
+                        'snapshot',
                         self.snapshots_file,
                         snapshot_data['duration'],
                         snapshot_data['tank_gallons'],
@@ -1422,38 +1670,42 @@ class SimplifiedMonitor:
                         snapshot_data['purge_count'],
                         snapshot_data['relay_status'],
                         occupied_status,
-                        self.state.outdoor_temp,
-                        self.state.indoor_temp,
-                        self.state.outdoor_humidity,
-                        self.state.baro_abs,
-                        self.state.wind_gust,
+                        state.outdoor_temp,
+                        state.indoor_temp,
+                        state.outdoor_humidity,
+                        state.baro_abs,
+                        state.wind_gust,
                         tank_rolling_gph,
                         snapshot_vehicle_count,
                         dosatron_gallons=_dosatron_gal,
                         bypass_gallons=_bypass_gal,
                         gallons_in=_gallons_in,
                         gallons_used=_gallons_used,
+                        timestamp=datetime.now(),
                     )
 
                     # Update last snapshot tank gallons for next delta calculation
-                    self.last_snapshot_tank_gallons = self.state.tank_gallons
+                    self.last_snapshot_tank_gallons = state.tank_gallons
 
                     # TANK_STOPPED_FILLING detection removed - consolidated with 6-hour well stagnation logic
                     # Well recovery notifications already handle stagnant period detection
 
-                    if self.debug:
-                        print(f"\n{datetime.now().strftime('%H:%M:%S')} - SNAPSHOT")
-                        print(f"  Tank: {snapshot_data['tank_gallons']:.0f} gal "
-                             f"(data age: {snapshot_data['tank_data_age']:.0f}s)")
-                        print(f"  Float: {snapshot_data['float_state']}")
-                        print(f"  Pressure HIGH: {snapshot_data['pressure_high_percent']:.1f}%")
-                        print(f"  Pumped: ~{snapshot_data['estimated_gallons']:.1f} gal")
+                    if debug:
+                        _age = snapshot_data['tank_data_age']
+                        lines = [
+                            f"\n{_hms()} - SNAPSHOT",
+                            f"  Tank: {_fmt_gal(snapshot_data['tank_gallons'])} "
+                            f"(data age: {'unknown' if _age is None else f'{_age:.0f}s'})",
+                            f"  Float: {snapshot_data['float_state']}",
+                            f"  Pressure HIGH: {snapshot_data['pressure_high_percent']:.1f}%",
+                            f"  Pumped: ~{snapshot_data['estimated_gallons']:.1f} gal",
+                        ]
                         if snapshot_data['purge_count'] > 0:
-                            print(f"  Purges: {snapshot_data['purge_count']}")
-                        print()
+                            lines.append(f"  Purges: {snapshot_data['purge_count']}")
+                        print("\n".join(lines) + "\n")
                     
                     # Reset for next interval
-                    self.snapshot_tracker.reset()
+                    tracker.reset()
                     self.next_snapshot_time = get_next_snapshot_time(
                         current_time,
                         self.snapshot_interval
@@ -1462,24 +1714,23 @@ class SimplifiedMonitor:
 
                 # DAILY STATUS EMAIL
                 if ENABLE_DAILY_STATUS_EMAIL and self.next_daily_status_time and current_time >= self.next_daily_status_time:
-                    current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
 
                     # Check if there's a check-in today
+                    today = today or datetime.fromtimestamp(current_time).date()
                     checkin_today = False
                     try:
                         reservations = load_reservations(RESERVATIONS_FILE)
-                        today = datetime.now().date()
                         for res in reservations:
                             checkin_date = parse_date(res.get('Check-In'))
                             if checkin_date and checkin_date.date() == today:
                                 checkin_today = True
                                 break
                     except Exception as e:
-                        if self.debug:
+                        if debug:
                             print(f"Could not check for check-ins today: {e}")
 
-                    if self.debug:
-                        print(f"\n{datetime.now().strftime('%H:%M:%S')} - DAILY STATUS EMAIL")
+                    if debug:
+                        print(f"\n{_hms()} - DAILY STATUS EMAIL")
                         print(f"  Sending daily status email...")
                         if checkin_today:
                             print(f"  Check-in today - adding heat reminder")
@@ -1487,10 +1738,10 @@ class SimplifiedMonitor:
                     # Customize subject and message based on check-in
                     if checkin_today:
                         subject = f"{current_gal:.0f} gal - Turn on heat!"
-                        message = f"⚠️ REMINDER: Tenant checking in today - turn on the heat!\n\nDaily status report for {datetime.now().strftime('%A, %B %d, %Y')}"
+                        message = f"⚠️ REMINDER: Tenant checking in today - turn on the heat!\n\nDaily status report for {today.strftime('%A, %B %d, %Y')}"
                     else:
                         subject = f"{current_gal:.0f} gal - Daily Status"
-                        message = f"Daily status report for {datetime.now().strftime('%A, %B %d, %Y')}"
+                        message = f"Daily status report for {today.strftime('%A, %B %d, %Y')}"
 
                     # Disk space warning
                     disk = shutil.disk_usage('/')
@@ -1506,7 +1757,7 @@ class SimplifiedMonitor:
                     sunset_image_link = None
                     try:
                         import glob as _glob
-                        yesterday_str = (datetime.now().date() - timedelta(days=1)).isoformat()
+                        yesterday_str = (today - timedelta(days=1)).isoformat()
                         best_dir = f'/home/pi/timelapses/best/{yesterday_str}'
                         # Prefer CLIP-scored (cl_) frames; fall back to CV-scored (cv_)
                         candidates = (sorted(_glob.glob(f'{best_dir}/cl_*.jpg')) or
@@ -1514,21 +1765,23 @@ class SimplifiedMonitor:
                         if candidates:
                             sunset_image_path = candidates[0]
                             sunset_image_link = f'{DASHBOARD_URL}timelapse/{yesterday_str}' if DASHBOARD_URL else None
-                            if self.debug:
+                            if debug:
                                 print(f"  Attaching sunset frame: {sunset_image_path}")
                     except Exception as e:
-                        if self.debug:
+                        if debug:
                             print(f"  Could not find sunset frame: {e}")
 
                     # Send daily status email
-                    send_email_notification(
+                    self._defer_io(
+                        'email',
                         subject=subject,
                         message=message,
                         priority='default',
                         dashboard_url=DASHBOARD_URL,
-                        chart_url=f"{DASHBOARD_URL}api/epaper.jpg?tenant=no",
-                        debug=self.debug,
+                        chart_url=_EPAPER_IMAGE_URL,
+                        debug=debug,
                         include_status=True,
+                        status_snapshot=self.get_email_status_snapshot(),
                         inline_image_path=sunset_image_path,
                         inline_image_link=sunset_image_link,
                     )
@@ -1542,20 +1795,19 @@ class SimplifiedMonitor:
                         DAILY_STATUS_EMAIL_TIME
                     )
 
-                    if self.debug:
+                    if debug:
                         next_daily_dt = datetime.fromtimestamp(self.next_daily_status_time)
                         print(f"  Next daily status email at: {next_daily_dt.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
                 # CHECKOUT REMINDER
                 if ENABLE_CHECKOUT_REMINDER and self.next_checkout_reminder_time and current_time >= self.next_checkout_reminder_time:
-                    current_gal = self.state.tank_gallons if self.state.tank_gallons else 0
 
                     # Check if there's a checkout today
                     checkout_today = False
                     checkout_guest = None
                     try:
                         reservations = load_reservations(RESERVATIONS_FILE)
-                        today = datetime.now().date()
+                        today = today or datetime.fromtimestamp(current_time).date()
                         for res in reservations:
                             checkout_date = parse_date(res.get('Checkout'))
                             if checkout_date and checkout_date.date() == today:
@@ -1563,24 +1815,26 @@ class SimplifiedMonitor:
                                 checkout_guest = res.get('Guest', 'Unknown')
                                 break
                     except Exception as e:
-                        if self.debug:
+                        if debug:
                             print(f"Could not check for checkouts today: {e}")
 
                     # Only send if there's a checkout today
                     if checkout_today:
-                        if self.debug:
-                            print(f"\n{datetime.now().strftime('%H:%M:%S')} - CHECKOUT REMINDER")
+                        if debug:
+                            print(f"\n{_hms()} - CHECKOUT REMINDER")
                             print(f"  Sending checkout reminder - {checkout_guest} checking out today")
 
                         # Send checkout reminder email
-                        send_email_notification(
+                        self._defer_io(
+                            'email',
                             subject=f"{current_gal:.0f} gal - Turn down thermostat!",
                             message=f"⚠️ REMINDER: {checkout_guest} checking out today - turn down the thermostat after checkout!",
                             priority='default',
                             dashboard_url=DASHBOARD_URL,
-                            chart_url=f"{DASHBOARD_URL}api/epaper.jpg?tenant=no",
-                            debug=self.debug,
-                            include_status=True
+                            chart_url=_EPAPER_IMAGE_URL,
+                            debug=debug,
+                            include_status=True,
+                            status_snapshot=self.get_email_status_snapshot(),
                         )
 
                         # Log the checkout reminder
@@ -1592,7 +1846,7 @@ class SimplifiedMonitor:
                         CHECKOUT_REMINDER_TIME
                     )
 
-                    if self.debug:
+                    if debug:
                         next_checkout_dt = datetime.fromtimestamp(self.next_checkout_reminder_time)
                         print(f"  Next checkout reminder at: {next_checkout_dt.strftime('%Y-%m-%d %H:%M:%S')}\n")
 
@@ -1600,7 +1854,7 @@ class SimplifiedMonitor:
                 # Prevents overflow during high-flow events that the 5-min tank sensor can't catch in time.
                 # Estimates current fill as (tank level when override turned on) + (dosatron gallons since).
                 # Self-healing: seeds tracking state from relay status each cycle.
-                if OVERRIDE_DOSATRON_SHUTOFF_ENABLED and self.relay_control_enabled:
+                if OVERRIDE_DOSATRON_SHUTOFF_ENABLED and relay_enabled:
                     _dos_relay = self.get_relay_status()
                     _dos_override_on = _dos_relay['supply_override'] == 'ON'
 
@@ -1608,14 +1862,13 @@ class SimplifiedMonitor:
                         if self._override_on_time is None:
                             # Override was already ON at startup or turned on externally; seed from now
                             self._override_on_time = current_time
-                            self._override_on_tank_gallons = self.state.tank_gallons
+                            self._override_on_tank_gallons = state.tank_gallons
                         elif self._override_on_tank_gallons is not None:
                             _dos_clicks = _count_dosatron_clicks(self._override_on_time, current_time)
                             _dos_gal = round(_dos_clicks * _DOSATRON_GPK, 2)
                             _dos_est = self._override_on_tank_gallons + _dos_gal
                             if _dos_est >= self.override_dosatron_shutoff_gallons:
-                                from monitor.relay import set_supply_override
-                                if set_supply_override('OFF', debug=self.debug):
+                                if set_supply_override('OFF', debug=debug):
                                     OVERRIDE_MANUAL_OFF_FILE.unlink(missing_ok=True)
                                     _dos_start_gal = self._override_on_tank_gallons
                                     self._override_on_time = None
@@ -1626,10 +1879,10 @@ class SimplifiedMonitor:
                                         f'est. now {_dos_est:.0f} gal >= {self.override_dosatron_shutoff_gallons})'
                                     )
                                     self.log_state_event('OVERRIDE_SHUTOFF', _dos_msg)
-                                    if self.debug:
+                                    if debug:
                                         print(f"  → {_dos_msg}")
                                     if (NOTIFY_OVERRIDE_SHUTOFF and
-                                            self.notification_manager.can_notify('override_shutoff_safety')):
+                                            notifications.can_notify('override_shutoff_safety')):
                                         self.send_alert(
                                             'NOTIFY_TANK_FULL',
                                             f"Est. {_dos_est:.0f} gal - Dosatron Safety Shutoff",
@@ -1641,13 +1894,24 @@ class SimplifiedMonitor:
                         self._override_on_time = None
                         self._override_on_tank_gallons = None
 
-                time.sleep(self.poll_interval)
+                # Wait out the rest of this poll period, waking early on a pressure edge.
+                # The period stays the upper bound: the dosatron shutoff and tank/snapshot
+                # schedules are checked each iteration.
+                wait_for_pressure_change(mono + poll_interval - time.monotonic())
 
         except Exception as e:
             import traceback
             tb = traceback.format_exc()
             print(f"\nFATAL ERROR in poll loop: {e}\n{tb}", flush=True)
-            self.log_state_event('CRASH', f"{type(e).__name__}: {e} | {tb.splitlines()[-2].strip()}")
+            # Write the CRASH row directly (its own O_APPEND write) instead of queueing it:
+            # shutdown() can stall in relay cleanup or the I/O worker join. Rows queued
+            # earlier go out first so CRASH follows the events that led up to it.
+            try:
+                self._flush_log_ring()
+                append_rows(self.events_file, [self._event_row(
+                    'CRASH', None, f"{type(e).__name__}: {e} | {tb.splitlines()[-2].strip()}")])
+            except Exception as log_err:
+                print(f"Could not log CRASH event: {log_err}", flush=True)
             self.shutdown()
             raise
         
@@ -1658,8 +1922,33 @@ class SimplifiedMonitor:
         self.log_state_event('SHUTDOWN', 'Clean shutdown')
         
         if self.relay_control_enabled:
-            from monitor.relay import cleanup_relays
+            abort_purge()  # close a purge valve left open by a purge thread
+            # Let it close the valve before the pins are released (only one runs at a time)
+            if self._purge_running():
+                self._purge_thread.join(timeout=2)
             cleanup_relays()
+
+        self._tank_executor.shutdown(wait=False, cancel_futures=True)
+
+        # Let queued snapshot/email jobs finish before the process exits, then
+        # stop the event writer and write any lines it didn't get to
+        self._io_queue.put(None)
+        self._io_thread.join(timeout=30)
+        if self._io_thread.is_alive():
+            # Still inside a job; events it logs from here on may not be written
+            print("I/O worker still busy at shutdown, not waiting for it", flush=True)
+        self._log_stopping = True
+        self._log_wake.set()
+        self._log_thread.join(timeout=5)
+        # Flushes and closes go through _log_lock, so a writer that is still
+        # running can't hit a closed handle (it would reopen the file instead)
+        self._flush_log_ring()
+        self._sync_event_logs(force=True)
+        with self._log_lock:
+            for f in self._log_handles.values():
+                f.close()
+            self._log_handles.clear()
+            self._log_unsynced.clear()
         
         if self.debug:
             print("\n✓ Monitor stopped")
@@ -3,6 +3,7 @@
 Standalone spindown filter purge script
 """
 import argparse
+import signal
 import sys
 
 try:
@@ -11,7 +12,7 @@ except ImportError:
     print("Error: RPi.GPIO not available", file=sys.stderr)
     sys.exit(1)
 
-from monitor.relay import init_relays, purge_spindown_filter, cleanup_relays
+from monitor.relay import init_relays, purge_spindown_filter, cleanup_relays, abort_purge, clear_purge_abort
 from monitor.config import PURGE_DURATION as DEFAULT_PURGE_DURATION
 
 
@@ -19,6 +20,7 @@ def trigger_purge(debug=False):
     """Trigger a purge cycle. Returns True on success. Safe to call from web server."""
     if not init_relays():
         return False
+    clear_purge_abort()
     try:
         return purge_spindown_filter(duration=DEFAULT_PURGE_DURATION, debug=debug)
     except Exception:
@@ -44,23 +46,31 @@ def main():
         print("Error: Could not initialize relay control", file=sys.stderr)
         sys.exit(1)
     
+    # Ctrl-C or SIGTERM (e.g. from systemd or the web server) cuts the purge
+    # wait short; purge_spindown_filter closes the valve itself
+    clear_purge_abort()
+    interrupted = []
+    def _abort(signum, frame):
+        interrupted.append(signum)
+        abort_purge()
+    signal.signal(signal.SIGINT, _abort)
+    signal.signal(signal.SIGTERM, _abort)
+    
     try:
         print(f"Starting spindown filter purge ({args.duration} seconds)...")
         
-        if purge_spindown_filter(duration=args.duration, debug=args.debug):
+        if not interrupted and purge_spindown_filter(duration=args.duration, debug=args.debug):
             print("✓ Purge completed successfully")
             return 0
+        elif interrupted:
+            print("\n\nInterrupted - valve closed")
+            return 128 + interrupted[0]
         else:
             print("✗ Purge failed", file=sys.stderr)
             return 1
             
-    except KeyboardInterrupt:
-        print("\n\nInterrupted - closing valve...")
-        cleanup_relays()
-        return 130
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
-        cleanup_relays()
         return 1
     finally:
         cleanup_relays()
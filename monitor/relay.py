@@ -1,8 +1,11 @@
 """
 Relay control for valves and pumps using RPi.GPIO
 """
+import logging
+import sys
 import time
 import subprocess
+import threading
 try:
     import RPi.GPIO as GPIO
     RELAY_AVAILABLE = True
@@ -13,6 +16,8 @@ except (ImportError, RuntimeError):
 from monitor.config import PURGE_DURATION
 from monitor.relay_state import RelayStateManager
 
+logger = logging.getLogger(__name__)
+
 # Global state manager instance
 _state_manager = None
 
@@ -29,6 +34,9 @@ SUPPLY_VALVE_PIN = 19      # Channel 2 - Primary inlet with float override
 SPIN_PURGE_VALVE_PIN = 13  # Channel 3 - Spindown filter purge
 RESERVED_PIN = 6           # Channel 4 - Reserved for future use
 
+# All relay channels, for bank-wide setup/output calls
+_RELAY_PINS = [BYPASS_VALVE_PIN, SUPPLY_VALVE_PIN, SPIN_PURGE_VALVE_PIN, RESERVED_PIN]
+
 # Relay configuration
 # Relays are ACTIVE LOW - writing LOW (0) activates the relay
 RELAY_ON = GPIO.LOW if RELAY_AVAILABLE else 0
@@ -36,15 +44,75 @@ RELAY_OFF = GPIO.HIGH if RELAY_AVAILABLE else 1
 
 _relays_initialized = False
 
+# init_relays/cleanup_relays calls nest within a process (e.g. two web requests
+# triggering a purge); only the last cleanup drives the relays OFF
+_relays_users = 0
+_relays_lock = threading.Lock()
+
+# Settle time after switching the relay pins to pulled-down inputs in
+# init_relays(preserve_state=True); the pin RC settles in well under this
+_PIN_SETTLE_S = 0.0001
+
+# Relay status reads are shared for this long so a burst of callers costs one
+# pin read: status-page/e-paper callers of get_all_relay_status() (which may
+# fork gpio), and the monitor's per-event get_relay_status()
+_STATUS_CACHE_TTL = 0.2
+_RELAY_STATUS_CACHE_TTL = 0.05
+_status_cache = {}  # reader -> (monotonic time, result)
+_status_lock = threading.Lock()
+
+def _cached_status(reader, ttl):
+    """Return a copy of reader()'s result, re-reading at most once per ttl seconds"""
+    with _status_lock:
+        now = time.monotonic()
+        ts, cached = _status_cache.get(reader, (0.0, None))
+        if cached is None or now - ts >= ttl:
+            cached = reader()
+            _status_cache[reader] = (now, cached)
+        return dict(cached)
+
+def _invalidate_status_cache():
+    """Drop the cached relay status after this process changes a relay"""
+    with _status_lock:
+        _status_cache.clear()
+
+# Set by abort_purge() to cut a running purge short; the purge wait returns
+# immediately and the valve is closed. The caller that owns the purge clears it
+# with clear_purge_abort() before starting one, so an abort arriving after that
+# is never lost.
+_purge_abort = threading.Event()
+
+def abort_purge():
+    """Close the purge valve early (safe to call from a signal handler)"""
+    _purge_abort.set()
+
+def clear_purge_abort():
+    """Re-arm purges after an earlier abort_purge(); call before starting a purge"""
+    _purge_abort.clear()
+
 def init_relays(preserve_state=False):
     """
     Initialize relay pins. Must be called before using relay functions.
     GPIO.setmode should already be called by gpio_helpers.init_gpio()
+    Each successful call must be paired with a cleanup_relays() call.
 
     Args:
         preserve_state: If True, read current pin states before setup to preserve them.
                        If False, initialize all relays to OFF state (default behavior).
     """
+    global _relays_users
+
+    with _relays_lock:
+        if _relays_users and _relays_initialized:
+            _relays_users += 1
+            return True
+        if not _setup_relays(preserve_state):
+            return False
+        _relays_users = 1
+        return True
+
+def _setup_relays(preserve_state):
+    """Configure the relay pins as outputs (see init_relays)"""
     global _relays_initialized
 
     if not RELAY_AVAILABLE:
@@ -67,14 +135,10 @@ def init_relays(preserve_state=False):
             try:
                 # Set as inputs with pull-down to read the actual hardware state
                 # Pull-down ensures we read 0 if the relay hardware is driving the pin low
-                GPIO.setup(BYPASS_VALVE_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-                GPIO.setup(SUPPLY_VALVE_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-                GPIO.setup(SPIN_PURGE_VALVE_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-                GPIO.setup(RESERVED_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+                GPIO.setup(_RELAY_PINS, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
 
                 # Small delay to let pins settle
-                import time
-                time.sleep(0.01)
+                time.sleep(_PIN_SETTLE_S)
 
                 # Read current electrical states
                 bypass_state = GPIO.input(BYPASS_VALVE_PIN)
@@ -93,38 +157,39 @@ def init_relays(preserve_state=False):
                 return True
             except Exception as e:
                 # If reading fails, fall through to default initialization
-                print(f"Could not preserve states ({e}), initializing to OFF")
+                logger.warning('Could not preserve relay states (%s), initializing to OFF', e)
                 pass
 
         # Set up relay pins as outputs with relays OFF (HIGH = off for active-low relays)
-        GPIO.setup(BYPASS_VALVE_PIN, GPIO.OUT, initial=RELAY_OFF)
-        GPIO.setup(SUPPLY_VALVE_PIN, GPIO.OUT, initial=RELAY_OFF)
-        GPIO.setup(SPIN_PURGE_VALVE_PIN, GPIO.OUT, initial=RELAY_OFF)
-        GPIO.setup(RESERVED_PIN, GPIO.OUT, initial=RELAY_OFF)
+        GPIO.setup(_RELAY_PINS, GPIO.OUT, initial=RELAY_OFF)
 
         _relays_initialized = True
         print("Relay control initialized - all valves OFF")
         return True
 
     except Exception as e:
-        print(f"Error initializing relays: {e}")
+        logger.error('Error initializing relays: %s', e)
         return False
 
 def cleanup_relays():
-    """Ensure all relays are OFF on shutdown"""
-    global _relays_initialized
+    """Ensure all relays are OFF on shutdown (once the last init_relays user is done)"""
+    global _relays_initialized, _relays_users
     
-    if RELAY_AVAILABLE and _relays_initialized:
+    with _relays_lock:
+        if not (RELAY_AVAILABLE and _relays_initialized):
+            return
+        _relays_users -= 1
+        if _relays_users > 0:
+            return
         try:
-            GPIO.output(BYPASS_VALVE_PIN, RELAY_OFF)
-            GPIO.output(SUPPLY_VALVE_PIN, RELAY_OFF)
-            GPIO.output(SPIN_PURGE_VALVE_PIN, RELAY_OFF)
-            GPIO.output(RESERVED_PIN, RELAY_OFF)
+            GPIO.output(_RELAY_PINS, RELAY_OFF)
             print("All relays turned OFF")
         except Exception as e:
-            print(f"Error during relay cleanup: {e}")
+            logger.error('Error during relay cleanup: %s', e)
         finally:
             _relays_initialized = False
+            _relays_users = 0
+            _invalidate_status_cache()
 
 def purge_spindown_filter(duration=None, debug=False):
     """
@@ -151,12 +216,18 @@ def purge_spindown_filter(duration=None, debug=False):
 
         # Open purge valve (ACTIVE LOW - write LOW to turn on)
         GPIO.output(SPIN_PURGE_VALVE_PIN, RELAY_ON)
+        _invalidate_status_cache()
 
-        # Wait for purge duration
-        time.sleep(duration)
+        # Wait for purge duration, or until abort_purge() is called
+        aborted = _purge_abort.wait(timeout=duration)
         
         # Close purge valve (write HIGH to turn off)
         GPIO.output(SPIN_PURGE_VALVE_PIN, RELAY_OFF)
+        _invalidate_status_cache()
+        
+        if aborted:
+            print("Spindown purge aborted - valve closed")
+            return False
         
         if debug:
             print(f"Spindown purge complete")
@@ -164,7 +235,7 @@ def purge_spindown_filter(duration=None, debug=False):
         return True
         
     except Exception as e:
-        print(f"Error during spindown purge: {e}")
+        logger.error('Error during spindown purge: %s', e)
         # Ensure valve is closed on error
         try:
             GPIO.output(SPIN_PURGE_VALVE_PIN, RELAY_OFF)
@@ -176,7 +247,12 @@ def get_relay_status():
     """
     Get current status of all relays.
     Returns dict with valve states (for compatibility with existing code).
+    Readings are cached for _RELAY_STATUS_CACHE_TTL seconds.
     """
+    return _cached_status(_read_relay_status, _RELAY_STATUS_CACHE_TTL)
+
+def _read_relay_status():
+    """Read bypass/supply override states (uncached)"""
     if not RELAY_AVAILABLE or not _relays_initialized:
         return {
             'bypass': 'OFF',
@@ -189,22 +265,29 @@ def get_relay_status():
             'supply_override': 'ON' if GPIO.input(SUPPLY_VALVE_PIN) == RELAY_ON else 'OFF'
         }
     except Exception as e:
-        print(f"Error reading relay status: {e}")
+        logger.error('Error reading relay status: %s', e)
         return {
             'bypass': 'UNKNOWN',
             'supply_override': 'UNKNOWN'
         }
 
-def _read_pin_via_gpio_command(pin):
-    """Read pin value using gpio command-line tool (works with multiple processes)"""
+def _read_pins_via_gpio_command(pins):
+    """
+    Read pin values using gpio command-line tool (works with multiple processes).
+
+    All pins are read from one shell invocation so a status read costs a single
+    subprocess round trip. A failed read prints 'x' to keep output lines aligned.
+    """
+    script = '; '.join(f'gpio -g read {pin} || echo x' for pin in pins)
     try:
-        result = subprocess.run(['gpio', '-g', 'read', str(pin)],
-                              capture_output=True, text=True, check=True, timeout=1)
-        value = int(result.stdout.strip())
-        # Relays are ACTIVE LOW - 0 means ON, 1 means OFF
-        return 'ON' if value == 0 else 'OFF'
+        values = subprocess.check_output(['sh', '-c', script],
+                                         stderr=subprocess.DEVNULL, timeout=2).split()
     except:
-        return 'N/A'
+        values = []
+    if len(values) != len(pins):
+        return ['N/A'] * len(pins)
+    # Relays are ACTIVE LOW - 0 means ON, 1 means OFF
+    return [{b'0': 'ON', b'1': 'OFF'}.get(v, 'N/A') for v in values]
 
 def get_all_relay_status():
     """
@@ -213,7 +296,12 @@ def get_all_relay_status():
 
     This function first tries to read via RPi.GPIO, but if that fails (e.g., another
     process is using GPIO), it falls back to using the `gpio` command-line tool.
+    Readings are cached for _STATUS_CACHE_TTL seconds.
     """
+    return _cached_status(_read_all_relay_status, _STATUS_CACHE_TTL)
+
+def _read_all_relay_status():
+    """Read all relay states from hardware (uncached)"""
     if not RELAY_AVAILABLE:
         return {
             'bypass': 'N/A',
@@ -233,16 +321,12 @@ def get_all_relay_status():
 
         def read_pin_if_output(pin):
             """Read pin value if it's configured as output"""
-            try:
-                func = GPIO.gpio_function(pin)
-                # GPIO.OUT = 0, GPIO.IN = 1
-                if func == GPIO.OUT:
-                    value = GPIO.input(pin)
-                    return 'ON' if value == RELAY_ON else 'OFF'
-                else:
-                    return 'N/A'
-            except:
+            # Pins this process set up in init_relays are known outputs; otherwise
+            # (e.g. the web server reading the monitor's pins) probe the function
+            # GPIO.OUT = 0, GPIO.IN = 1
+            if not _relays_initialized and GPIO.gpio_function(pin) != GPIO.OUT:
                 return 'N/A'
+            return 'ON' if GPIO.input(pin) == RELAY_ON else 'OFF'
 
         result = {
             'bypass': read_pin_if_output(BYPASS_VALVE_PIN),
@@ -261,14 +345,15 @@ def get_all_relay_status():
 
     # Fallback to gpio command-line tool (works even when another process is using GPIO)
     try:
+        bypass, supply, purge, reserved = _read_pins_via_gpio_command(_RELAY_PINS)
         return {
-            'bypass': _read_pin_via_gpio_command(BYPASS_VALVE_PIN),
-            'supply_override': _read_pin_via_gpio_command(SUPPLY_VALVE_PIN),
-            'purge': _read_pin_via_gpio_command(SPIN_PURGE_VALVE_PIN),
-            'reserved': _read_pin_via_gpio_command(RESERVED_PIN)
+            'bypass': bypass,
+            'supply_override': supply,
+            'purge': purge,
+            'reserved': reserved
         }
     except Exception as e:
-        print(f"Error reading relay status: {e}")
+        logger.error('Error reading relay status: %s', e)
         return {
             'bypass': 'UNKNOWN',
             'supply_override': 'UNKNOWN',
@@ -276,93 +361,96 @@ def get_all_relay_status():
             'reserved': 'UNKNOWN'
         }
 
-def set_supply_override(state, debug=False):
+# Valves that can be switched from any process via the gpio command
+_SWITCHABLE_RELAYS = {
+    'bypass': ('Bypass valve', BYPASS_VALVE_PIN),
+    'supply_override': ('Supply override', SUPPLY_VALVE_PIN),
+}
+
+def set_relays(bypass=None, supply_override=None, debug=False):
     """
-    Turn supply override valve ON or OFF using gpio command.
+    Turn bypass and/or supply override valves ON or OFF using gpio command.
 
     This function uses the gpio command-line tool instead of RPi.GPIO to avoid
-    multi-process conflicts when the monitor is running.
+    multi-process conflicts when the monitor is running. When both valves are
+    given they are written from one shell invocation and saved in one write;
+    each write is attempted even if the other fails.
 
     Args:
-        state: 'ON' or 'OFF'
+        bypass: 'ON', 'OFF', or None to leave unchanged
+        supply_override: 'ON', 'OFF', or None to leave unchanged
         debug: Print debug messages
 
     Returns:
-        True if successful, False otherwise
+        True if every requested valve was set, False otherwise
     """
-    import sys
-
-    if state not in ['ON', 'OFF']:
-        if debug:
-            print(f"Invalid state '{state}', must be 'ON' or 'OFF'", file=sys.stderr)
-        return False
-
-    # Active-low relay: 0=ON, 1=OFF
-    value = '0' if state == 'ON' else '1'
+    changes = {name: state for name, state in
+               (('bypass', bypass), ('supply_override', supply_override))
+               if state is not None}
 
-    try:
-        # Use gpio command to avoid multi-process conflicts
-        result = subprocess.run(['gpio', '-g', 'write', str(SUPPLY_VALVE_PIN), value],
-                              capture_output=True, text=True, check=True, timeout=2)
-        if debug:
-            print(f"Supply override turned {state}")
-
-        # Save state to disk
-        get_state_manager().set_supply_override(state)
+    for state in changes.values():
+        if state not in ['ON', 'OFF']:
+            if debug:
+                print(f"Invalid state '{state}', must be 'ON' or 'OFF'", file=sys.stderr)
+            return False
+    if not changes:
         return True
-    except subprocess.TimeoutExpired:
-        print(f"Timeout setting supply override to {state}", file=sys.stderr)
-        return False
-    except subprocess.CalledProcessError as e:
-        print(f"Error setting supply override to {state}: {e.stderr}", file=sys.stderr)
-        return False
-    except Exception as e:
-        print(f"Error setting supply override to {state}: {e}", file=sys.stderr)
-        return False
+    return _apply_relays(changes, debug) == changes
 
-def set_bypass(state, debug=False):
-    """
-    Turn bypass valve ON or OFF using gpio command.
-
-    This function uses the gpio command-line tool instead of RPi.GPIO to avoid
-    multi-process conflicts when the monitor is running.
-
-    Args:
-        state: 'ON' or 'OFF'
-        debug: Print debug messages
-
-    Returns:
-        True if successful, False otherwise
-    """
-    import sys
-
-    if state not in ['ON', 'OFF']:
-        if debug:
-            print(f"Invalid state '{state}', must be 'ON' or 'OFF'", file=sys.stderr)
-        return False
+def _apply_relays(changes, debug=False):
+    """Write valve states ({name: 'ON'/'OFF'}); returns the ones actually applied"""
+    what = ' and '.join(f"{name.replace('_', ' ')} to {state}" for name, state in changes.items())
 
     # Active-low relay: 0=ON, 1=OFF
-    value = '0' if state == 'ON' else '1'
+    writes = [['gpio', '-g', 'write', str(_SWITCHABLE_RELAYS[name][1]), '0' if state == 'ON' else '1']
+              for name, state in changes.items()]
+    if len(writes) == 1:
+        cmd = writes[0]
+    else:
+        # Run every write even if an earlier one fails; exit non-zero if any did
+        cmd = ['sh', '-c', 's=0; ' + ' '.join(f"{' '.join(w)} || s=1;" for w in writes) + ' exit $s']
 
     try:
         # Use gpio command to avoid multi-process conflicts
-        result = subprocess.run(['gpio', '-g', 'write', str(BYPASS_VALVE_PIN), value],
-                              capture_output=True, text=True, check=True, timeout=2)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                       check=True, timeout=2)
         if debug:
-            print(f"Bypass valve turned {state}")
+            for name, state in changes.items():
+                print(f"{_SWITCHABLE_RELAYS[name][0]} turned {state}")
+
+        _invalidate_status_cache()
 
         # Save state to disk
-        get_state_manager().set_bypass(state)
-        return True
+        get_state_manager().set_states(**changes)
+        return dict(changes)
     except subprocess.TimeoutExpired:
-        print(f"Timeout setting bypass to {state}", file=sys.stderr)
-        return False
+        logger.error('Timeout setting %s', what)
     except subprocess.CalledProcessError as e:
-        print(f"Error setting bypass to {state}: {e.stderr}", file=sys.stderr)
-        return False
+        logger.error('Error setting %s: %s', what, e.stderr.decode(errors='replace').strip())
     except Exception as e:
-        print(f"Error setting bypass to {state}: {e}", file=sys.stderr)
-        return False
+        logger.error('Error setting %s: %s', what, e)
+
+    # Some writes may have gone through despite the failure; record what the pins show
+    _invalidate_status_cache()
+    actual = _save_actual_states(changes)
+    return {name: state for name, state in changes.items() if actual.get(name) == state}
+
+def _save_actual_states(names):
+    """Re-read the named valves' pins, save the states that could be read and return them"""
+    pins = [_SWITCHABLE_RELAYS[name][1] for name in names]
+    actual = {name: state for name, state in zip(names, _read_pins_via_gpio_command(pins))
+              if state != 'N/A'}
+    if actual:
+        get_state_manager().set_states(**actual)
+    return actual
+
+def set_supply_override(state, debug=False):
+    """Turn supply override valve ON or OFF (see set_relays)"""
+    return set_relays(supply_override=state, debug=debug)
+
+def set_bypass(state, debug=False):
+    """Turn bypass valve ON or OFF (see set_relays)"""
+    return set_relays(bypass=state, debug=debug)
 
 
 def restore_relay_states(debug=False):
@@ -374,22 +462,19 @@ def restore_relay_states(debug=False):
         dict with 'supply_override' and 'bypass' states that were restored
     """
     state_mgr = get_state_manager()
-    restored = {}
+    saved = {
+        'supply_override': state_mgr.get_supply_override(),
+        'bypass': state_mgr.get_bypass(),
+    }
+    saved = {name: state for name, state in saved.items() if state in ['ON', 'OFF']}
 
-    # Restore supply override
-    saved_override = state_mgr.get_supply_override()
-    if saved_override in ['ON', 'OFF']:
-        if set_supply_override(saved_override, debug=debug):
-            restored['supply_override'] = saved_override
-            if debug:
-                print(f"Restored supply override to {saved_override}")
+    if not saved:
+        return {}
 
-    # Restore bypass
-    saved_bypass = state_mgr.get_bypass()
-    if saved_bypass in ['ON', 'OFF']:
-        if set_bypass(saved_bypass, debug=debug):
-            restored['bypass'] = saved_bypass
-            if debug:
-                print(f"Restored bypass to {saved_bypass}")
+    # Restore both valves in one gpio round trip; a valve that fails doesn't undo the other
+    restored = _apply_relays(saved, debug)
 
+    if debug:
+        for name, state in restored.items():
+            print(f"Restored {name.replace('_', ' ')} to {state}")
     return restored
@@ -3,9 +3,13 @@ Persistent relay state management
 Saves and restores relay states across service restarts
 """
 import json
+import logging
+import os
 from pathlib import Path
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 class RelayStateManager:
     """Manages persistent relay state storage"""
@@ -21,7 +25,7 @@ class RelayStateManager:
                 with open(self.state_file, 'r') as f:
                     return json.load(f)
         except Exception as e:
-            print(f"Warning: Could not load relay state: {e}")
+            logger.warning('Could not load relay state: %s', e)
 
         # Default state
         return {
@@ -31,13 +35,20 @@ class RelayStateManager:
         }
 
     def _save_state(self):
-        """Save relay state to disk"""
+        """Save relay state to disk (atomically; the web server and monitor both write it)"""
         try:
             self.state['last_updated'] = datetime.now().isoformat()
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            # Encode up front so the file gets one write, and a bad value
+            # fails before the temp file is created
+            payload = json.dumps(self.state, separators=(',', ':')).encode()
+            tmp = self.state_file.with_name(f'{self.state_file.name}.{os.getpid()}.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.state_file)
         except Exception as e:
-            print(f"Warning: Could not save relay state: {e}")
+            logger.warning('Could not save relay state: %s', e)
 
     def get_supply_override(self):
         """Get saved supply override state"""
@@ -49,6 +60,13 @@ class RelayStateManager:
             self.state['supply_override'] = state
             self._save_state()
 
+    def set_states(self, **states):
+        """Save several relay states (e.g. bypass='ON', supply_override='OFF') in one write"""
+        states = {name: state for name, state in states.items() if state in ['ON', 'OFF']}
+        if states:
+            self.state.update(states)
+            self._save_state()
+
     def get_bypass(self):
         """Get saved bypass state"""
         return self.state.get('bypass', 'OFF')
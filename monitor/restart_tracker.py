@@ -3,18 +3,35 @@ Track service restarts and alert on excessive restart loops.
 Sends at most one email per day if restarts exceed threshold.
 """
 import json
+import logging
 import os
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime
 
 from monitor.config import DASHBOARD_URL
 from monitor.email_notifier import send_email_notification
 from monitor.logger import log_event
 
+logger = logging.getLogger(__name__)
+
 # Default settings
 DEFAULT_TRACKER_FILE = 'restart_tracker.json'
 RESTART_THRESHOLD = 4  # Alert if more than this many restarts in 24h
 ALERT_COOLDOWN_HOURS = 24  # Only send one alert per day
+# Only the newest restarts are kept, so a long crash loop can't grow the file
+# (and the per-start parse) without bound; counts saturate at this many
+MAX_RESTARTS_KEPT = 64
+
+
+def _epoch(value):
+    """Restart/alert time as epoch seconds; also accepts the ISO strings older versions wrote"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except (TypeError, ValueError):
+        return None
 
 
 def load_tracker_data(tracker_file):
@@ -30,12 +47,17 @@ def load_tracker_data(tracker_file):
 
 
 def save_tracker_data(tracker_file, data):
-    """Save tracker data to JSON file"""
+    """Save tracker data to JSON file (atomically, so a kill mid-write can't reset the count)"""
     try:
-        with open(tracker_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = json.dumps(data, separators=(',', ':')).encode()
+        tmp = tracker_file + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, tracker_file)
     except IOError as e:
-        print(f"Warning: Could not save restart tracker: {e}")
+        logger.warning('Could not save restart tracker: %s', e)
 
 
 def check_and_record_restart(events_file, tracker_file=DEFAULT_TRACKER_FILE, debug=False):
@@ -45,43 +67,33 @@ def check_and_record_restart(events_file, tracker_file=DEFAULT_TRACKER_FILE, deb
     Returns:
         dict with 'restart_count' (in last 24h) and 'alerted' (bool if alert sent)
     """
-    now = datetime.now()
-    cutoff = now - timedelta(hours=24)
-    alert_cutoff = now - timedelta(hours=ALERT_COOLDOWN_HOURS)
+    now = int(time.time())
+    cutoff = now - 24 * 3600
+    alert_cutoff = now - ALERT_COOLDOWN_HOURS * 3600
 
     # Load existing data
     data = load_tracker_data(tracker_file)
 
-    # Parse restart timestamps and filter to last 24h
-    recent_restarts = []
-    for ts_str in data.get('restarts', []):
-        try:
-            ts = datetime.fromisoformat(ts_str)
-            if ts > cutoff:
-                recent_restarts.append(ts_str)
-        except ValueError:
-            continue
-
-    # Add current restart
-    recent_restarts.append(now.isoformat())
+    # Parse restart timestamps and filter to last 24h (newest entries only)
+    recent_restarts = deque(maxlen=MAX_RESTARTS_KEPT)
+    for value in data.get('restarts', [])[-MAX_RESTARTS_KEPT:]:
+        ts = _epoch(value)
+        if ts is not None and ts > cutoff:
+            recent_restarts.append(ts)
+
+    # Add current restart (drops the oldest once the window is full)
+    recent_restarts.append(now)
     restart_count = len(recent_restarts)
+    count_str = f"{restart_count}+" if restart_count >= MAX_RESTARTS_KEPT else str(restart_count)
 
     # Check if we should alert
     alerted = False
-    last_alert = data.get('last_alert')
-    can_alert = True
-
-    if last_alert:
-        try:
-            last_alert_dt = datetime.fromisoformat(last_alert)
-            if last_alert_dt > alert_cutoff:
-                can_alert = False
-        except ValueError:
-            pass
+    last_alert = _epoch(data.get('last_alert'))
+    can_alert = last_alert is None or last_alert <= alert_cutoff
 
     if restart_count > RESTART_THRESHOLD:
         # Slow down crash loops before doing anything else
-        print(f"Crash loop detected ({restart_count} restarts in 24h), sleeping 20s...")
+        print(f"Crash loop detected ({count_str} restarts in 24h), sleeping 20s...")
         time.sleep(20)
 
     if restart_count > RESTART_THRESHOLD and can_alert:
@@ -96,13 +108,13 @@ def check_and_record_restart(events_file, tracker_file=DEFAULT_TRACKER_FILE, deb
             None,  # tank_percentage
             None,  # estimated_gallons
             None,  # relay_status
-            f"{restart_count} restarts in last 24 hours"
+            f"{count_str} restarts in last 24 hours"
         )
 
         # Send email alert
         success = send_email_notification(
-            subject=f"Pumphouse Monitor - Excessive Restarts ({restart_count}x)",
-            message=f"The pumphouse monitor has restarted {restart_count} times in the last 24 hours. "
+            subject=f"Pumphouse Monitor - Excessive Restarts ({count_str}x)",
+            message=f"The pumphouse monitor has restarted {count_str} times in the last 24 hours. "
                     f"This may indicate a crash loop or system instability. "
                     f"Check the system logs for errors: journalctl -u pumphouse-monitor -n 100",
             priority='high',
@@ -113,19 +125,19 @@ def check_and_record_restart(events_file, tracker_file=DEFAULT_TRACKER_FILE, deb
         )
 
         if success:
-            data['last_alert'] = now.isoformat()
+            data['last_alert'] = now
             alerted = True
             if debug:
-                print(f"Sent excessive restarts alert ({restart_count} restarts in 24h)")
+                print(f"Sent excessive restarts alert ({count_str} restarts in 24h)")
         elif debug:
             print(f"Failed to send excessive restarts alert")
 
     # Save updated data
-    data['restarts'] = recent_restarts
+    data['restarts'] = list(recent_restarts)
     save_tracker_data(tracker_file, data)
 
     if debug:
-        print(f"Restart #{restart_count} in last 24h (threshold: >{RESTART_THRESHOLD})")
+        print(f"Restart #{count_str} in last 24h (threshold: >{RESTART_THRESHOLD})")
 
     return {
         'restart_count': restart_count,
@@ -11,6 +11,7 @@ import asyncio
 import fcntl
 import json
 import logging
+import random
 import time
 import urllib.request
 from datetime import datetime
@@ -23,6 +24,12 @@ logger = logging.getLogger(__name__)
 _VEHICLE_COUNT_CACHE = Path.home() / '.config' / 'pumphouse' / 'vehicle_count.json'
 _VEHICLE_COUNT_TTL   = 2 * 3600  # seconds
 
+# Retries after a failed Ring fetch: exponential backoff (1s, 2s, ...) plus up to 250ms
+# jitter. Kept at one because every attempt runs under the cross-process lock, and a
+# hung fetch holds it for the full request timeout.
+_FETCH_RETRIES      = 1
+_FETCH_RETRY_BASE_S = 1.0
+
 # Directory for ML model files (lazy-downloaded on first vehicle-count call)
 _MODELS_DIR   = Path(__file__).parent.parent / 'models'
 _YOLO_CFG     = _MODELS_DIR / 'yolov4-tiny.cfg'
@@ -95,9 +102,12 @@ def get_snapshot(token_file: Path, camera_name: str = '', force_refresh: bool =
                     return RING_CACHE_FILE.read_bytes()
 
             data = _fetch_from_ring(token_file, camera_name)
-            if data is None:
-                logger.warning('Ring fetch attempt 1 failed; retrying in 5s')
-                time.sleep(5)
+            for attempt in range(_FETCH_RETRIES):
+                if data is not None:
+                    break
+                delay = _FETCH_RETRY_BASE_S * (2 ** attempt) + random.uniform(0, 0.25)
+                logger.warning('Ring fetch attempt %d failed; retrying in %.1fs', attempt + 1, delay)
+                time.sleep(delay)
                 data = _fetch_from_ring(token_file, camera_name)
 
             if data:
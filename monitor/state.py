@@ -1,11 +1,13 @@
 """
 Simple state tracking for monitoring
 """
-from datetime import datetime
 
 class SystemState:
     """Track current system state"""
 
+    __slots__ = ('tank_gallons', 'tank_depth', 'tank_percentage', 'float_state',
+                 'outdoor_temp', 'indoor_temp', 'outdoor_humidity', 'baro_abs', 'wind_gust')
+
     def __init__(self):
         self.tank_gallons = None
         self.tank_depth = None
@@ -1,9 +1,61 @@
 """
 Shared statistics and analytics functions
 """
+import bisect
 import csv
+import io
 import os
 from datetime import datetime
+from itertools import accumulate
+from operator import itemgetter
+
+# Parsed snapshots CSVs: abspath -> (st_ino, st_mtime_ns, bytes consumed, tail bytes, header, rows)
+_SNAPSHOT_CACHE = {}
+_TAIL_CHECK_BYTES = 64
+
+
+def _read_snapshot_rows(snapshots_file):
+    """
+    Header and rows (lists of fields) of a snapshots CSV, cached across calls.
+
+    Between rotations the file only grows, so after an append just the new
+    lines are parsed. A rewrite (rotation, column migration) is caught by the
+    inode or by the bytes before the cached offset changing, and re-read in
+    full. Callers must not modify the returned rows.
+    """
+    path = os.path.abspath(snapshots_file)
+    st = os.stat(path)
+    cached = _SNAPSHOT_CACHE.get(path)
+    if cached and cached[:3] == (st.st_ino, st.st_mtime_ns, st.st_size):
+        return cached[4], cached[5]
+
+    with open(path, 'rb') as f:
+        header, rows, start = None, [], 0
+        if cached and cached[2] and cached[0] == st.st_ino and st.st_size >= cached[2]:
+            _, _, offset, tail, cached_header, cached_rows = cached
+            f.seek(offset - len(tail))
+            if f.read(len(tail)) == tail:
+                header, rows, start = cached_header, cached_rows, offset
+        f.seek(start)
+        data = f.read()
+
+    # Only consume complete lines; a row being appended right now is picked up next call
+    consumed = data[:data.rfind(b'\n') + 1]
+    reader = csv.reader(io.StringIO(consumed.decode('utf-8', errors='replace'), newline=''))
+    if header is None:
+        header = next(reader, [])
+    new_rows = list(reader)
+    if new_rows:
+        rows = rows + new_rows
+
+    offset = start + len(consumed)
+    if start:
+        tail = (cached[3] + consumed)[-_TAIL_CHECK_BYTES:]
+    else:
+        tail = consumed[-_TAIL_CHECK_BYTES:]
+    _SNAPSHOT_CACHE[path] = (st.st_ino, st.st_mtime_ns, offset, tail, header, rows)
+    return header, rows
+
 
 def _find_recovery_in_data(snapshots, threshold_gallons, stagnation_hours, max_stagnation_gain, lookback_hours=24):
     """
@@ -14,7 +66,7 @@ def _find_recovery_in_data(snapshots, threshold_gallons, stagnation_hours, max_s
     Uses FIXED time windows to prevent false positives from continuous slow fill.
 
     Args:
-        snapshots: List of dicts with 'ts' (datetime) and 'gallons' (float)
+        snapshots: List of dicts with 'ts' (datetime) and 'gallons' (float), oldest first
         threshold_gallons: Min gallons to count as recovery
         stagnation_hours: Length of stagnation period to verify (also used for recovery window)
         max_stagnation_gain: Max gain during stagnation to be considered "stagnant"
@@ -59,36 +111,45 @@ def _find_recovery_in_data(snapshots, threshold_gallons, stagnation_hours, max_s
         return None
 
     # Work with most recent data
-    now = snapshots[-1]['ts']
-    lookback_cutoff = now.timestamp() - (lookback_hours * 3600)
+    all_times = [s['ts'].timestamp() for s in snapshots]
+    lookback_cutoff = all_times[-1] - (lookback_hours * 3600)
 
-    # Filter to recent snapshots only
-    recent_snapshots = [s for s in snapshots if s['ts'].timestamp() >= lookback_cutoff]
+    # Filter to recent snapshots only, as parallel lists of epoch seconds and gallons
+    recent_snapshots = [s for s, t in zip(snapshots, all_times) if t >= lookback_cutoff]
+    ts_arr = [t for t in all_times if t >= lookback_cutoff]
+    gal_arr = [s['gallons'] for s in recent_snapshots]
 
     if len(recent_snapshots) < 2:
         return None
 
+    # Upper bound on the recovery gain of any window ending at or before each
+    # index: the highest later level minus the level at the window end.
+    future_max = list(accumulate(reversed(gal_arr), max))[::-1]
+    max_gain_by = list(accumulate((peak - gallons for peak, gallons in zip(future_max, gal_arr)), max))
+
     # Search for: stagnation window followed by significant gain
     # Check each possible stagnation window (going backwards = most recent first)
-    for end_idx in range(len(recent_snapshots) - 1, 0, -1):
-        period_end = recent_snapshots[end_idx]
-        period_end_time = period_end['ts'].timestamp()
-        period_end_gallons = period_end['gallons']
+    start_idx = len(ts_arr) - 2
+    for end_idx in range(len(ts_arr) - 1, 0, -1):
+        if max_gain_by[end_idx] < threshold_gallons:
+            break  # No earlier window can recover enough
+
+        period_end_time = ts_arr[end_idx]
+        period_end_gallons = gal_arr[end_idx]
 
         # Define stagnation window: N hours before this snapshot
         stagnation_start_time = period_end_time - (stagnation_hours * 3600)
 
-        # Find snapshot at start of stagnation window
-        period_start = None
-        for snapshot in reversed(recent_snapshots[:end_idx]):
-            if snapshot['ts'].timestamp() <= stagnation_start_time:
-                period_start = snapshot
-                break
+        # Find snapshot at start of stagnation window. The window only moves
+        # earlier as end_idx does, so start_idx never has to move forward again.
+        start_idx = min(start_idx, end_idx - 1)
+        while start_idx >= 0 and ts_arr[start_idx] > stagnation_start_time:
+            start_idx -= 1
 
-        if period_start is None:
+        if start_idx < 0:
             continue
 
-        period_start_gallons = period_start['gallons']
+        period_start_gallons = gal_arr[start_idx]
 
         # CHECK #1: Was tank truly stagnant? (didn't gain more than threshold)
         gain_during_stagnation = period_end_gallons - period_start_gallons
@@ -101,21 +162,17 @@ def _find_recovery_in_data(snapshots, threshold_gallons, stagnation_hours, max_s
         recovery_end_time = period_end_time + (stagnation_hours * 3600)
 
         # Find the snapshot closest to recovery_end_time
-        recovery_snapshot = None
-        for snapshot in recent_snapshots[end_idx:]:
-            if snapshot['ts'].timestamp() >= recovery_end_time:
-                recovery_snapshot = snapshot
-                break
+        recovery_idx = bisect.bisect_left(ts_arr, recovery_end_time, lo=end_idx)
 
         # If we don't have data far enough ahead, use the last snapshot we have
-        if recovery_snapshot is None:
-            recovery_snapshot = recent_snapshots[-1]
+        if recovery_idx == len(ts_arr):
+            recovery_idx -= 1
 
-        recovery_gain = recovery_snapshot['gallons'] - period_end_gallons
+        recovery_gain = gal_arr[recovery_idx] - period_end_gallons
 
         if recovery_gain >= threshold_gallons:
             # FOUND IT! Return start of stagnation as unique identifier
-            return period_start['ts']
+            return recent_snapshots[start_idx]['ts']
 
     return None
 
@@ -148,18 +205,18 @@ def find_last_refill(snapshots_file, threshold_gallons=50, stagnation_hours=6, m
 
     try:
         # Read and parse snapshot data
-        with open(snapshots_file, 'r') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        header, rows = _read_snapshot_rows(snapshots_file)
+        ts_i = header.index('timestamp')
+        g_i = header.index('tank_gallons')
 
         snapshots = []
         for row in rows:
             try:
                 snapshots.append({
-                    'ts': datetime.fromisoformat(row['timestamp']),
-                    'gallons': float(row['tank_gallons'])
+                    'ts': datetime.fromisoformat(row[ts_i]),
+                    'gallons': float(row[g_i])
                 })
-            except (ValueError, KeyError):
+            except (ValueError, IndexError):
                 continue
 
         snapshots.sort(key=lambda x: x['ts'])
@@ -202,9 +259,9 @@ def find_high_flow_event(snapshots_file, gph_threshold=60, window_hours=6,
         return None, None
 
     try:
-        with open(snapshots_file, 'r') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        header, rows = _read_snapshot_rows(snapshots_file)
+        ts_i = header.index('timestamp')
+        d_i = header.index('tank_gallons_delta')
 
         if len(rows) < averaging_snapshots + 1:
             return None, None
@@ -216,38 +273,36 @@ def find_high_flow_event(snapshots_file, gph_threshold=60, window_hours=6,
         parsed_rows = []
         for row in rows:
             try:
-                ts = datetime.fromisoformat(row['timestamp'])
+                ts = datetime.fromisoformat(row[ts_i])
                 # Only look at snapshots within the window
                 if ts.timestamp() < window_cutoff:
                     continue
 
-                delta = float(row['tank_gallons_delta']) if row.get('tank_gallons_delta') else 0
-                parsed_rows.append({
-                    'ts': ts,
-                    'delta': delta
-                })
-            except (ValueError, KeyError):
+                delta = float(row[d_i]) if len(row) > d_i and row[d_i] else 0
+                parsed_rows.append((ts, delta))
+            except (ValueError, IndexError):
                 continue
 
         if len(parsed_rows) < averaging_snapshots:
             return None, None
 
-        # Ensure rows are sorted by timestamp
-        parsed_rows.sort(key=lambda x: x['ts'])
+        # Ensure rows are sorted by timestamp, then split into parallel lists
+        parsed_rows.sort(key=itemgetter(0))
+        timestamps = [ts for ts, _ in parsed_rows]
+        deltas = [delta for _, delta in parsed_rows]
 
         # Calculate GPH using sliding window of N snapshots
-        for i in range(averaging_snapshots - 1, len(parsed_rows)):
-            # Get last N snapshots
-            window = parsed_rows[i - averaging_snapshots + 1:i + 1]
+        total_minutes = averaging_snapshots * snapshot_interval_minutes
+        for i in range(averaging_snapshots - 1, len(deltas)):
+            first = i - averaging_snapshots + 1
 
-            # Calculate average GPH over this window
-            total_gain = sum(s['delta'] for s in window)
-            total_minutes = averaging_snapshots * snapshot_interval_minutes
+            # Calculate average GPH over the last N snapshots
+            total_gain = sum(deltas[first:i + 1])
             avg_gph = (total_gain / total_minutes) * 60 if total_minutes > 0 else 0
 
             if avg_gph >= gph_threshold:
                 # Return timestamp of first snapshot in this high-flow window
-                return window[0]['ts'], avg_gph
+                return timestamps[first], avg_gph
 
         return None, None
 
@@ -275,9 +330,9 @@ def find_backflush_event(snapshots_file, threshold_gallons=50, window_snapshots=
         return None, None
 
     try:
-        with open(snapshots_file, 'r') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        header, rows = _read_snapshot_rows(snapshots_file)
+        ts_i = header.index('timestamp')
+        d_i = header.index('tank_gallons_delta')
 
         if len(rows) < window_snapshots + 1:
             return None, None
@@ -290,45 +345,42 @@ def find_backflush_event(snapshots_file, threshold_gallons=50, window_snapshots=
         parsed_rows = []
         for row in rows:
             try:
-                ts = datetime.fromisoformat(row['timestamp'])
-                delta = float(row['tank_gallons_delta']) if row.get('tank_gallons_delta') else 0
-                parsed_rows.append({
-                    'ts': ts,
-                    'delta': delta
-                })
-            except (ValueError, KeyError):
+                ts = datetime.fromisoformat(row[ts_i])
+                delta = float(row[d_i]) if len(row) > d_i and row[d_i] else 0
+                parsed_rows.append((ts, delta))
+            except (ValueError, IndexError):
                 continue
 
         if len(parsed_rows) < window_snapshots:
             return None, None
 
-        # Ensure rows are sorted by timestamp
-        parsed_rows.sort(key=lambda x: x['ts'])
+        # Ensure rows are sorted by timestamp, then split into parallel lists
+        parsed_rows.sort(key=itemgetter(0))
+        timestamps = [ts for ts, _ in parsed_rows]
+        deltas = [delta for _, delta in parsed_rows]
+
+        start_time_mins = start_hour * 60 + start_min
+        end_time_mins = end_hour * 60 + end_min
 
         # Look for significant decline during backflush time window
         # Iterate backwards to find most recent event
-        for i in range(len(parsed_rows) - 1, window_snapshots - 1, -1):
-            current_snapshot = parsed_rows[i]
-
+        for i in range(len(timestamps) - 1, window_snapshots - 1, -1):
             # Check if timestamp is within backflush time window
-            ts_hour = current_snapshot['ts'].hour
-            ts_min = current_snapshot['ts'].minute
-            ts_time_mins = ts_hour * 60 + ts_min
-            start_time_mins = start_hour * 60 + start_min
-            end_time_mins = end_hour * 60 + end_min
+            ts = timestamps[i]
+            ts_time_mins = ts.hour * 60 + ts.minute
 
             if not (start_time_mins <= ts_time_mins <= end_time_mins):
                 continue
 
             # Calculate total decline over window_snapshots
-            window = parsed_rows[i - window_snapshots + 1:i + 1]
-            total_decline = sum(s['delta'] for s in window)
+            first = i - window_snapshots + 1
+            total_decline = sum(deltas[first:i + 1])
 
             # Backflush is a DECLINE (negative delta)
             if total_decline <= -threshold_gallons:
                 gallons_used = abs(total_decline)
                 # Return timestamp of first snapshot in backflush window
-                return window[0]['ts'], gallons_used
+                return timestamps[first], gallons_used
 
         return None, None
 
@@ -369,9 +421,11 @@ def find_full_flow_periods(snapshots_file, pressure_threshold=90.0, lookback_hou
         return []
 
     try:
-        with open(snapshots_file, 'r') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        header, rows = _read_snapshot_rows(snapshots_file)
+        ts_i = header.index('timestamp')
+        p_i = header.index('pressure_high_percent')
+        g_i = header.index('tank_gallons')
+        est_i = header.index('estimated_gallons_pumped') if 'estimated_gallons_pumped' in header else None
 
         if len(rows) < 1:
             return []
@@ -383,15 +437,15 @@ def find_full_flow_periods(snapshots_file, pressure_threshold=90.0, lookback_hou
         snapshots = []
         for row in rows:
             try:
-                ts = datetime.fromisoformat(row['timestamp'])
+                ts = datetime.fromisoformat(row[ts_i])
                 if ts.timestamp() < cutoff:
                     continue
 
-                pressure_pct = float(row['pressure_high_percent'])
-                tank_gallons = float(row['tank_gallons'])
+                pressure_pct = float(row[p_i])
+                tank_gallons = float(row[g_i])
 
                 # Parse estimated_gallons_pumped (might have + sign)
-                est_gal_str = row.get('estimated_gallons_pumped', '0')
+                est_gal_str = row[est_i] if est_i is not None and len(row) > est_i else '0'
                 est_gallons = float(est_gal_str.replace('+', '')) if est_gal_str else 0.0
 
                 snapshots.append({
@@ -400,7 +454,7 @@ def find_full_flow_periods(snapshots_file, pressure_threshold=90.0, lookback_hou
                     'tank_gallons': tank_gallons,
                     'est_gallons': est_gallons
                 })
-            except (ValueError, KeyError):
+            except (ValueError, IndexError):
                 continue
 
         if len(snapshots) < 1:
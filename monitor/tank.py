@@ -2,6 +2,7 @@
 Tank level monitoring via web scraping
 """
 import re
+import threading
 from datetime import datetime, timedelta
 import requests
 from bs4 import BeautifulSoup
@@ -9,6 +10,17 @@ from bs4 import BeautifulSoup
 from monitor.config import TANK_HEIGHT_INCHES, TANK_CAPACITY_GALLONS
 from monitor.gpio_helpers import read_float_sensor
 
+# Keep-alive session per thread so repeated scrapes reuse the TCP/TLS connection;
+# requests doesn't promise a Session is safe to share across threads
+_local = threading.local()
+
+def _thread_session():
+    """This thread's keep-alive session, created on first use"""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
 def calculate_gallons(depth_inches):
     """Calculate gallons based on linear relationship"""
     if depth_inches is None:
@@ -31,10 +43,10 @@ def parse_last_updated(last_updated_text):
     
     return last_updated
 
-def get_tank_data(url, timeout=10):
-    """Scrape tank data from PT website"""
+def get_tank_data(url, timeout=10, session=None):
+    """Scrape tank data from PT website (uses this thread's keep-alive session unless given one)"""
     try:
-        response = requests.get(url, timeout=timeout)
+        response = (session or _thread_session()).get(url, timeout=timeout)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -47,7 +47,7 @@ from monitor.gpio_helpers import (
 )
 from monitor.tank import get_tank_data
 from monitor.check import read_temp_humidity, format_pressure_state, format_float_state
-from monitor.relay import get_all_relay_status, set_supply_override, set_bypass
+from monitor.relay import get_all_relay_status, set_supply_override, set_bypass, set_relays
 from monitor.stats import find_last_refill
 from monitor.occupancy import (
     get_occupancy_status, get_current_and_upcoming_reservations,
@@ -2757,10 +2757,8 @@ def control(token):
     elif token == SECRET_TEST_FILTER_TOKEN and SECRET_TEST_FILTER_TOKEN:
         # Test filter mode: override ON (pump runs) + bypass OFF (water through filter)
         _cancel_all_bypass_modes()
-        ok1 = set_bypass('OFF', debug=False)
         OVERRIDE_MANUAL_OFF_FILE.unlink(missing_ok=True)
-        ok2 = set_supply_override('ON', debug=False)
-        success = ok1 and ok2
+        success = set_relays(bypass='OFF', supply_override='ON', debug=False)
         action_taken = "Test filter mode: Override ON, Bypass OFF"
     else:
         return Response('Invalid token', status=403)